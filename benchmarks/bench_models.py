@@ -0,0 +1,160 @@
+"""
+Compares validation time of the kind-discriminated K8sResource union with the
+previous union (Deployment/Service/ConfigMap/dict, tried in turn, Deployment
+spec untyped) and with the current typed models in a plain, undiscriminated
+union, on synthetic resource lists.
+
+    python -m benchmarks.bench_models --sizes 100,1000,10000
+"""
+import argparse
+import gc
+import json
+import time
+from typing import Any, Dict, List, Union
+from pydantic import BaseModel, Field
+from devops_cli.models.k8s import TYPED_RESOURCES, K8sGenericResource, K8sMetadata, K8sResourceList, ServiceSpec
+
+
+# The resource models as they were before the discriminated union
+class LegacyDeployment(BaseModel):
+    apiVersion: str = "apps/v1"
+    kind: str = "Deployment"
+    metadata: K8sMetadata
+    spec: Any
+
+class LegacyService(BaseModel):
+    apiVersion: str = "v1"
+    kind: str = "Service"
+    metadata: K8sMetadata
+    spec: ServiceSpec
+
+class LegacyConfigMap(BaseModel):
+    apiVersion: str = "v1"
+    kind: str = "ConfigMap"
+    metadata: K8sMetadata
+    data: Dict[str, str] = Field(default_factory=dict)
+
+class LegacyResourceList(BaseModel):
+    resources: List[Union[LegacyDeployment, LegacyService, LegacyConfigMap, Dict[str, Any]]]
+
+# Today's typed models without the discriminator: isolates the cost of trying each member
+class UndiscriminatedResourceList(BaseModel):
+    resources: List[Union[TYPED_RESOURCES + (K8sGenericResource,)]]
+
+
+def deployment(i: int) -> dict:
+    name = f"app-{i}"
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {"name": name, "labels": {"app": name, "environment": "dev"}},
+        "spec": {
+            "replicas": 2,
+            "selector": {"matchLabels": {"app": name}},
+            "template": {
+                "metadata": {"labels": {"app": name}},
+                "spec": {
+                    "containers": [{
+                        "name": name,
+                        "image": "nginx:1.25",
+                        "ports": [{"containerPort": 80}],
+                        "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}, "limits": {"cpu": "500m", "memory": "512Mi"}},
+                        "livenessProbe": {"httpGet": {"path": "/", "port": 80}},
+                        "readinessProbe": {"httpGet": {"path": "/", "port": 80}},
+                    }]
+                },
+            },
+        },
+    }
+
+
+def service(i: int) -> dict:
+    name = f"app-{i}"
+    return {
+        "apiVersion": "v1",
+        "kind": "Service",
+        "metadata": {"name": name, "labels": {"app": name}},
+        "spec": {"selector": {"app": name}, "ports": [{"port": 80, "targetPort": 80}]},
+    }
+
+
+def configmap(i: int) -> dict:
+    return {
+        "apiVersion": "v1",
+        "kind": "ConfigMap",
+        "metadata": {"name": f"app-{i}-config"},
+        "data": {"LOG_LEVEL": "info", "MAX_CONNECTIONS": "100"},
+    }
+
+
+def ingress(i: int) -> dict:
+    name = f"app-{i}"
+    return {
+        "apiVersion": "networking.k8s.io/v1",
+        "kind": "Ingress",
+        "metadata": {"name": name},
+        "spec": {"rules": [{"host": f"{name}.example.com", "http": {"paths": [
+            {"path": "/", "pathType": "Prefix", "backend": {"service": {"name": name, "port": {"number": 80}}}}
+        ]}}]},
+    }
+
+
+BUILDERS = (deployment, service, configmap, ingress)
+
+
+def synthetic_payload(size: int) -> dict:
+    return {"resources": [BUILDERS[i % len(BUILDERS)](i // len(BUILDERS)) for i in range(size)]}
+
+
+def best_of(fn, repeat: int) -> float:
+    # Like timeit, keep the garbage collector out of the measurement
+    best = float("inf")
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+            gc.collect()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best
+
+
+def run(sizes: List[int], repeat: int) -> List[dict]:
+    results = []
+    for size in sizes:
+        payload = synthetic_payload(size)
+        results.append({
+            "size": size,
+            "legacy_seconds": best_of(lambda: LegacyResourceList.model_validate(payload), repeat),
+            "undiscriminated_seconds": best_of(lambda: UndiscriminatedResourceList.model_validate(payload), repeat),
+            "discriminated_seconds": best_of(lambda: K8sResourceList.model_validate(payload), repeat),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="10,100,1000,10000", help="Comma-separated resource counts")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is kept)")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    args = parser.parse_args()
+
+    results = run([int(s) for s in args.sizes.split(",")], args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'resources':>10} {'legacy (ms)':>12} {'undiscriminated (ms)':>21} {'discriminated (ms)':>19}")
+    for r in results:
+        print(
+            f"{r['size']:>10} {r['legacy_seconds'] * 1000:>12.2f}"
+            f" {r['undiscriminated_seconds'] * 1000:>21.2f} {r['discriminated_seconds'] * 1000:>19.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Offline stand-ins for the OpenAI API and the kubeconform binary.
+"""
+import asyncio
+import glob
+import itertools
+import json
+import os
+import stat
+import sys
+import time
+from types import SimpleNamespace
+from typing import List, Optional
+from devops_cli.llm_client import LLMClient
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def load_recorded_responses(directory: str = FIXTURES_DIR) -> List[str]:
+    """
+    Returns the recorded message.content strings, in file name order.
+    """
+    responses = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.json"))):
+        with open(path) as f:
+            responses.append(json.load(f)["content"])
+    return responses
+
+
+class FakeChatCompletions:
+    """
+    Mimics client.chat.completions: replays recorded contents round-robin,
+    optionally after a fixed latency, as a full response or as stream chunks.
+    """
+
+    def __init__(self, responses: List[str], latency: float = 0.0, chunk_size: int = 64):
+        self._responses = itertools.cycle(responses)
+        self.latency = latency
+        self.chunk_size = chunk_size
+        self.calls = 0
+
+    def create(self, stream: bool = False, **kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+        return self._respond(stream, kwargs)
+
+    def _respond(self, stream: bool, kwargs: dict):
+        self.calls += 1
+        content = next(self._responses)
+        usage = SimpleNamespace(prompt_tokens=len(json.dumps(kwargs["messages"])) // 4, completion_tokens=len(content) // 4)
+        if not stream:
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=usage
+            )
+        return self._chunks(content, usage)
+
+    def _chunks(self, content: str, usage):
+        for i in range(0, len(content), self.chunk_size):
+            delta = SimpleNamespace(content=content[i:i + self.chunk_size])
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)], usage=None)
+        yield SimpleNamespace(choices=[], usage=usage)
+
+
+class FakeAsyncChatCompletions(FakeChatCompletions):
+    async def create(self, stream: bool = False, **kwargs):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._respond(stream, kwargs)
+
+
+class FakeLLMClient(LLMClient):
+    """
+    A real LLMClient (cache, parsing and retry code included) whose OpenAI
+    clients are replaced by recorded-response fakes.
+    """
+
+    def __init__(self, responses: Optional[List[str]] = None, latency: float = 0.0, **kwargs):
+        super().__init__(api_key="offline", **kwargs)
+        responses = responses or load_recorded_responses()
+        self.completions = FakeChatCompletions(responses, latency)
+        self._client = SimpleNamespace(chat=SimpleNamespace(completions=self.completions))
+        self._async_client = SimpleNamespace(
+            chat=SimpleNamespace(completions=FakeAsyncChatCompletions(responses, latency)),
+            close=self._noop_close,
+        )
+
+    @staticmethod
+    async def _noop_close():
+        pass
+
+
+STUB_KUBECONFORM = '''#!{python}
+# Offline kubeconform stand-in: reports every document in every file as valid
+# in kubeconform's "-output json -verbose" format.
+import json, sys
+args = sys.argv[1:]
+if args == ["-v"]:
+    print("v0.0.0-stub")
+    sys.exit(0)
+resources = []
+for path in (a for a in args if a.endswith((".yaml", ".yml", ".json"))):
+    with open(path) as f:
+        for doc in f.read().split("\\n---"):
+            kind = next((l.split(":", 1)[1].strip() for l in doc.splitlines() if l.startswith("kind:")), "")
+            if kind:
+                resources.append({{"filename": path, "kind": kind, "name": "", "version": "", "status": "statusValid", "msg": ""}})
+print(json.dumps({{"resources": resources}}))
+'''
+
+
+def write_stub_kubeconform(directory: str) -> str:
+    """
+    Writes an executable kubeconform stub into directory and returns its path.
+    """
+    path = os.path.join(directory, "kubeconform")
+    with open(path, "w") as f:
+        f.write(STUB_KUBECONFORM.format(python=sys.executable))
+    os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return path
@@ -0,0 +1,246 @@
+"""
+Offline benchmark suite for the generate -> render -> validate pipeline.
+
+    python -m benchmarks.run --out bench.json
+    python -m benchmarks.run --compare bench.json --max-regression 25
+
+Nothing here touches the network: the LLM is a FakeLLMClient replaying
+recorded responses from benchmarks/fixtures and kubeconform is a stub script.
+Results are JSON so runs can be compared across commits.
+"""
+import argparse
+import datetime
+import io
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import Callable, List, Optional
+from benchmarks.bench_models import best_of, synthetic_payload
+from benchmarks.fakes import FakeLLMClient, write_stub_kubeconform
+from devops_cli.generators.k8s_generator import K8sGenerator
+from devops_cli.generators.templates import TemplateBackend
+from devops_cli.models.internal import GenerationRequest
+from devops_cli.models.k8s import K8sResourceList
+from devops_cli.renderers.yaml_renderer import YamlRenderer
+from devops_cli.validators.k8s_validator import K8sValidator, ValidationCache
+from devops_cli.validators.policy import PolicyEngine
+
+DEFAULT_SIZES = "1,10,100,1000,10000"
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Suite:
+    def __init__(self, repeat: int):
+        self.repeat = repeat
+        self.results: List[dict] = []
+
+    def record(self, name: str, seconds: float, size: Optional[int] = None, **extra):
+        entry = {"name": name, "size": size, "seconds": seconds, **extra}
+        self.results.append(entry)
+        label = f"{name}[{size}]" if size is not None else name
+        print(f"{label:<40} {seconds * 1000:>10.2f} ms", file=sys.stderr)
+
+    def time(self, name: str, fn: Callable, size: Optional[int] = None, repeat: Optional[int] = None, **extra):
+        self.record(name, best_of(fn, repeat or self.repeat), size, **extra)
+
+
+def bench_model_validate(suite: Suite, sizes: List[int]):
+    for size in sizes:
+        payload = synthetic_payload(size)
+        suite.time("model_validate", lambda: K8sResourceList.model_validate(payload), size)
+
+
+def bench_render(suite: Suite, sizes: List[int], workdir: str):
+    renderer = YamlRenderer()
+    for size in sizes:
+        resources = K8sResourceList.model_validate(synthetic_payload(size))
+        out = os.path.join(workdir, f"render-{size}")
+
+        def full():
+            shutil.rmtree(out, ignore_errors=True)
+            renderer.render(resources, out)
+
+        suite.time("render", full, size)
+        suite.results[-1]["bytes_written"] = sum(os.path.getsize(os.path.join(out, f)) for f in os.listdir(out))
+        suite.time("render_incremental_unchanged", lambda: renderer.render(resources, out, incremental=True), size)
+        suite.time("render_stream", lambda: renderer.render_stream(resources, io.StringIO()), size)
+
+
+def bench_policy(suite: Suite, sizes: List[int]):
+    engine = PolicyEngine(environment="prod")
+    for size in sizes:
+        payload = synthetic_payload(size)
+        resources = K8sResourceList.model_validate(payload)
+        suite.time("policy_check", lambda: engine.check(resources), size)
+        # Fixing mutates the resources, so each run validates a fresh copy (included in the time)
+        suite.time("policy_fix", lambda: engine.check(K8sResourceList.model_validate(payload), fix=True), size)
+
+
+def bench_kubeconform(suite: Suite, sizes: List[int], workdir: str):
+    stub = write_stub_kubeconform(workdir)
+    renderer = YamlRenderer()
+    for size in sizes:
+        out = os.path.join(workdir, f"validate-{size}")
+        renderer.render(K8sResourceList.model_validate(synthetic_payload(size)), out)
+        cache_path = os.path.join(workdir, f"validation-cache-{size}.json")
+
+        def cold():
+            if os.path.exists(cache_path):
+                os.unlink(cache_path)
+            validator = K8sValidator(cache=ValidationCache(cache_path))
+            validator.kubeconform_path = stub
+            validator.validate(out)
+
+        def warm():
+            validator = K8sValidator(cache=ValidationCache(cache_path))
+            validator.kubeconform_path = stub
+            validator.validate(out)
+
+        # Spawning processes dominates; fewer repeats keep the suite quick
+        suite.time("kubeconform_validate_cold", cold, size, repeat=min(suite.repeat, 3))
+        suite.time("kubeconform_validate_cached", warm, size)
+
+
+def bench_generate(suite: Suite, calls: int):
+    generator = K8sGenerator(FakeLLMClient())
+    request = GenerationRequest(prompt="nginx deployment with 2 replicas", environment="prod")
+
+    def generate():
+        for _ in range(calls):
+            generator.generate(request)
+
+    def generate_stream():
+        for _ in range(calls):
+            list(generator.generate_stream(request))
+
+    suite.time("generate_fake_llm", generate, calls)
+    suite.time("generate_stream_fake_llm", generate_stream, calls)
+
+    template_generator = K8sGenerator(FakeLLMClient(), backends=[TemplateBackend()])
+
+    def generate_template():
+        for _ in range(calls):
+            template_generator.generate(request)
+
+    suite.time("generate_template", generate_template, calls)
+
+
+def bench_cli_cold_start(suite: Suite):
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    commands = {
+        "cli_import": [sys.executable, "-c", "import devops_cli.cli"],
+        "cli_help": [sys.executable, "-m", "devops_cli.cli", "--help"],
+    }
+    for name, cmd in commands.items():
+        suite.time(
+            name,
+            lambda: subprocess.run(cmd, cwd=REPO_ROOT, env=env, capture_output=True, check=True),
+        )
+
+    # Cumulative import time of devops_cli.cli as reported by -X importtime (microseconds)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import devops_cli.cli"],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    match = re.search(r"\|\s*(\d+)\s*\|\s*devops_cli\.cli\s*$", proc.stderr, re.MULTILINE)
+    if match:
+        suite.record("cli_importtime", int(match.group(1)) / 1e6)
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: List[dict], baseline_path: str, max_regression: Optional[float]) -> int:
+    with open(baseline_path) as f:
+        baseline = {(r["name"], r["size"]): r["seconds"] for r in json.load(f)["results"]}
+
+    regressions = 0
+    print(f"\n{'benchmark':<40} {'baseline (ms)':>14} {'current (ms)':>13} {'change':>8}")
+    for r in current:
+        before = baseline.get((r["name"], r["size"]))
+        if not before:
+            continue
+        change = (r["seconds"] - before) / before * 100
+        flag = ""
+        if max_regression is not None and change > max_regression:
+            flag = "  REGRESSION"
+            regressions += 1
+        label = f"{r['name']}[{r['size']}]" if r["size"] is not None else r["name"]
+        print(f"{label:<40} {before * 1000:>14.2f} {r['seconds'] * 1000:>13.2f} {change:>+7.1f}%{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline devops-cli benchmark suite")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated resource counts")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is kept)")
+    parser.add_argument("--calls", type=int, default=100, help="Generator calls per generate measurement")
+    parser.add_argument("--only", default=None, help="Comma-separated groups: models,render,policy,validate,generate,cli")
+    parser.add_argument("--out", default=None, help="Write JSON results to this file (default: stdout)")
+    parser.add_argument("--compare", default=None, help="Baseline JSON file to compare against")
+    parser.add_argument("--max-regression", type=float, default=None, help="Fail if any benchmark is slower by more than this percentage")
+    parser.add_argument("--startup-budget-ms", type=float, default=None, help="Fail if cli_importtime exceeds this budget")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    groups = set(args.only.split(",")) if args.only else {"models", "render", "policy", "validate", "generate", "cli"}
+    suite = Suite(args.repeat)
+
+    workdir = tempfile.mkdtemp(prefix="devops-cli-bench-")
+    try:
+        if "models" in groups:
+            bench_model_validate(suite, sizes)
+        if "render" in groups:
+            bench_render(suite, sizes, workdir)
+        if "policy" in groups:
+            bench_policy(suite, sizes)
+        if "validate" in groups:
+            bench_kubeconform(suite, sizes, workdir)
+        if "generate" in groups:
+            bench_generate(suite, args.calls)
+        if "cli" in groups:
+            bench_cli_cold_start(suite)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "results": suite.results,
+    }
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    failed = False
+    if args.compare:
+        failed = compare(suite.results, args.compare, args.max_regression) > 0
+    if args.startup_budget_ms is not None:
+        startup = next((r["seconds"] for r in suite.results if r["name"] == "cli_importtime"), None)
+        if startup is not None and startup * 1000 > args.startup_budget_ms:
+            print(f"\nCLI import time {startup * 1000:.1f} ms exceeds budget of {args.startup_budget_ms:.1f} ms")
+            failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
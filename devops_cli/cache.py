@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import time
+from typing import Optional
+from devops_cli.config import cache_dir
+from devops_cli.fsutil import atomic_write
+
+DEFAULT_MAX_ENTRIES = 500
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+DEFAULT_MAX_AGE = 7 * 24 * 3600  # seconds
+
+
+class ResponseCache:
+    """
+    On-disk, content-addressed cache of raw LLM responses.
+
+    Each entry is a single file named after the hash of everything that
+    influences the completion. Writes go through temp-file-plus-rename and
+    reads tolerate entries vanishing underneath them, so several CLI
+    processes can share one cache directory without locking.
+    The file mtime doubles as the LRU timestamp: it is bumped on every hit.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age: float = DEFAULT_MAX_AGE,
+    ):
+        self.directory = directory or cache_dir("responses")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, user_prompt: str, temperature: float, response_format: dict) -> str:
+        payload = json.dumps(
+            {
+                "model": model,
+                "system_prompt": system_prompt,
+                "user_prompt": user_prompt,
+                "temperature": temperature,
+                "response_format": response_format,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            mtime = os.stat(path).st_mtime
+            if time.time() - mtime > self.max_age:
+                self._remove(path)
+                self.stats["misses"] += 1
+                return None
+            with open(path) as f:
+                content = f.read()
+            # Touch the entry so eviction treats it as recently used
+            os.utime(path)
+        except FileNotFoundError:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        return content
+
+    def set(self, key: str, content: str) -> None:
+        try:
+            atomic_write(self._path(key), content)
+        except OSError:
+            # The cache is best-effort; a read-only or full disk must not fail generation
+            return
+        self.stats["writes"] += 1
+        self.evict()
+
+    def delete(self, key: str) -> None:
+        self._remove(self._path(key))
+
+    def _entries(self) -> list:
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return entries
+        for name in names:
+            if not name.endswith(".json") or name.startswith(".tmp-"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.unlink(path)
+            self.stats["evictions"] += 1
+        except FileNotFoundError:
+            # Another process got there first
+            pass
+
+    def evict(self) -> None:
+        """
+        Drops expired entries, then least recently used ones until the cache
+        fits within max_entries and max_bytes.
+        """
+        now = time.time()
+        entries = []
+        for mtime, size, path in self._entries():
+            if now - mtime > self.max_age:
+                self._remove(path)
+            else:
+                entries.append((mtime, size, path))
+
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        while entries and (len(entries) > self.max_entries or total > self.max_bytes):
+            _, size, path = entries.pop(0)
+            self._remove(path)
+            total -= size
+
+    def clear(self) -> None:
+        for _, _, path in self._entries():
+            self._remove(path)
+
+    def info(self) -> dict:
+        entries = self._entries()
+        return {
+            "directory": self.directory,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            **self.stats,
+        }
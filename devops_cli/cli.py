@@ -1,13 +1,16 @@
 import typer
 import os
 import sys
+import time
 from rich.console import Console
 from rich.panel import Panel
-from typing import Optional
-from devops_cli.models.internal import GenerationRequest
-from devops_cli.generators.k8s_generator import K8sGenerator
-from devops_cli.renderers.yaml_renderer import YamlRenderer
-from devops_cli.validators.k8s_validator import K8sValidator
+from typing import List, Optional
+from devops_cli.config import DEFAULT_CONCURRENCY, DEFAULT_KUBERNETES_VERSION
+from devops_cli.telemetry import Tracer, get_tracer
+
+# Heavy dependencies (openai, pydantic models, ruamel.yaml, validators) are
+# imported inside the commands that use them, so --help and shell completion
+# stay fast.
 
 app = typer.Typer(help="AI-powered DevOps CLI")
 k8s_app = typer.Typer(help="Kubernetes management commands")
@@ -15,67 +18,481 @@ app.add_typer(k8s_app, name="k8s")
 console = Console()
 
 
+def report_trace(tracer: Tracer, profile: bool, trace_file: Optional[str]):
+    if trace_file:
+        tracer.write(trace_file)
+        console.print(f"[dim]Trace written to {trace_file}[/dim]")
+    if not profile or not tracer.spans:
+        return
+
+    from rich.table import Table
+
+    total = max(span.duration for span in tracer.spans if span.depth == 0)
+    table = Table(title="Profile")
+    table.add_column("Stage")
+    table.add_column("Time (ms)", justify="right")
+    table.add_column("%", justify="right")
+    table.add_column("Details")
+    for span in tracer.spans:
+        details = ", ".join(f"{k}={v}" for k, v in span.attrs.items())
+        table.add_row(
+            "  " * span.depth + span.name,
+            f"{span.duration * 1000:.1f}",
+            f"{span.duration / total * 100:.0f}" if total else "-",
+            details,
+        )
+    console.print(table)
+
+
+def report_policy(result, fix: bool):
+    if not result.violations:
+        console.print("[green]Policy checks passed.[/green]")
+        return
+
+    colors = {"error": "red", "warning": "yellow", "info": "blue"}
+    for v in result.violations:
+        where = f"{v.kind}/{v.name}" if v.name else v.file
+        if v.file and v.name:
+            where = f"{v.file}: {where}"
+        status = " [green](fixed)[/green]" if v.fixed else ""
+        color = colors.get(v.severity, "white")
+        console.print(f" [{color}]{v.severity}[/{color}] {where} {v.path}: {v.message} [dim]({v.rule})[/dim]{status}")
+    open_count = len(result.violations) - result.fixed_count
+    summary = f"{len(result.violations)} policy violation(s) in {result.resource_count} resource(s), {result.fixed_count} fixed"
+    if open_count and not fix and any(v.fixable for v in result.violations):
+        summary += "; run with --fix to repair the fixable ones"
+    console.print(summary)
+
+
 @k8s_app.command()
 def generate(
     prompt: str = typer.Option(..., "--prompt", "-p", help="Description of the Kubernetes resources to generate"),
-    output: str = typer.Option("./k8s", "--output", "-o", help="Output directory"),
-    env: str = typer.Option("dev", "--env", "-e", help="Target environment"),
+    output: str = typer.Option("./k8s", "--output", "-o", help="Output directory (a file with --single-file, '-' for stdout)"),
+    env: List[str] = typer.Option(["dev"], "--env", "-e", help="Target environment; repeat or comma-separate for a base + overlays layout"),
+    profiles_file: Optional[str] = typer.Option(None, "--profiles", help="Per-environment profile file (namespace, replicas, labels, resources)"),
     namespace: str = typer.Option("default", "-n", help="Namespace"),
     expose: bool = typer.Option(False, help="Whether to expose deployments via Service"),
-    expose_type: str = typer.Option("ClusterIP", help="Service type if exposed (ClusterIP, NodePort, LoadBalancer)")
+    expose_type: str = typer.Option("ClusterIP", help="Service type if exposed (ClusterIP, NodePort, LoadBalancer)"),
+    image: Optional[str] = typer.Option(None, "--image", help="Container image to use, e.g. nginx:1.25"),
+    ports: Optional[List[int]] = typer.Option(None, "--port", help="Container port (repeatable)"),
+    replicas: Optional[int] = typer.Option(None, "--replicas", help="Number of replicas"),
+    backend: str = typer.Option("auto", "--backend", help="Generator backend: auto (local templates, then OpenAI), template or llm"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the on-disk LLM response cache"),
+    refresh_cache: bool = typer.Option(False, "--refresh-cache", help="Ignore cached responses but store the fresh one"),
+    stream: bool = typer.Option(False, "--stream", help="Stream the completion and write each resource as soon as it arrives"),
+    validator_backend: str = typer.Option("kubeconform", "--validator", help="Validation backend (kubeconform, native)"),
+    k8s_version: Optional[str] = typer.Option(None, "--k8s-version", help=f"Kubernetes version to validate against (native default: {DEFAULT_KUBERNETES_VERSION})"),
+    schema_location: Optional[str] = typer.Option(None, "--schema-location", help="Local schema bundle directory for the native validator"),
+    incremental: bool = typer.Option(False, "--incremental", help="Only rewrite files whose content changed (atomic writes)"),
+    prune: bool = typer.Option(False, "--prune", help="Delete files left over from a previous render into the output directory"),
+    single_file: bool = typer.Option(False, "--single-file", help="Write all resources as one multi-document YAML file"),
+    policy: bool = typer.Option(True, "--policy/--no-policy", help="Check the resources against best-practice policies"),
+    fix: bool = typer.Option(False, "--fix", help="Repair policy violations with deterministic defaults before writing"),
+    policy_config: Optional[str] = typer.Option(None, "--policy-config", help="YAML/JSON file of per-rule severities (error, warning, info, off)"),
+    strict_policy: bool = typer.Option(False, "--strict-policy", help="Write nothing and exit 1 when policy errors remain (after --fix)"),
+    profile: bool = typer.Option(False, "--profile", help="Print per-stage timings and token usage"),
+    trace_file: Optional[str] = typer.Option(None, "--trace-file", help="Write a Chrome trace-event JSON file of the run")
 ):
     """
     Generate Kubernetes manifests using AI.
     """
-    console.print(Panel(f"Generating resources for: [bold]{prompt}[/bold]", title="DevOps CLI"))
-
-    # 1. Build Request
-    req = GenerationRequest(
-        prompt=prompt,
-        environment=env,
-        namespace=namespace,
-        expose=expose,
-        expose_type=expose_type
-    )
+    from devops_cli.models.internal import GenerationRequest, ValidationResult
+    from devops_cli.models.k8s import K8sResourceList
+    from devops_cli.cache import ResponseCache
+    from devops_cli.llm_client import LLMClient
+    from devops_cli.generators.k8s_generator import K8sGenerator
+    from devops_cli.generators.templates import TemplateBackend
+    from devops_cli.renderers.yaml_renderer import YamlRenderer
+    from devops_cli.renderers.kustomize import apply_profile, load_profiles, resolve_profiles
+    from devops_cli.validators.k8s_validator import K8sValidator
+    from devops_cli.validators.native_validator import NativeValidator
+    from devops_cli.validators.policy import PolicyEngine, default_rules, load_policy_config
 
-    # 2. Generator (LLM)
+    environments = list(dict.fromkeys(e.strip() for value in env for e in value.split(",") if e.strip()))
+    overlays = len(environments) > 1
+    if not environments:
+        console.print("[red]No environment given.[/red]")
+        raise typer.Exit(code=1)
+    if overlays and (stream or single_file or output == "-"):
+        console.print("[red]Several environments need a directory output[/red] (no --stream, --single-file or '-o -').")
+        raise typer.Exit(code=1)
     try:
-        generator = K8sGenerator()
-        console.print("[yellow]Wait... Contacting OpenAI...[/yellow]")
-        resources = generator.generate(req)
-        console.print(f"[green]Successfully generated {len(resources.resources)} resources![/green]")
+        profiles = resolve_profiles(environments, load_profiles(profiles_file) if profiles_file else None)
     except Exception as e:
-        console.print(f"[red]Error generating resources:[/red] {e}")
-        # In a real app we might want to check for OPENAI_API_KEY specifically
-        if "OPENAI_API_KEY" not in os.environ:
-             console.print("[bold red]Tip:[/bold red] Make sure OPENAI_API_KEY is set.")
+        console.print(f"[red]Error reading profiles:[/red] {e}")
         raise typer.Exit(code=1)
 
-    # 3. Render
+    if fix and stream and output == "-":
+        console.print("[red]--fix cannot rewrite documents already streamed to stdout.[/red]")
+        raise typer.Exit(code=1)
     try:
-        renderer = YamlRenderer()
-        files = renderer.render(resources, output)
-        console.print(f"Written {len(files)} files to [bold]{output}[/bold]")
-        for f in files:
-            console.print(f" - {f}")
+        # An overlay base carries no environment label: each overlay adds its own
+        engine = PolicyEngine(
+            rules=default_rules(labels=("app",)) if overlays else None,
+            severities=load_policy_config(policy_config) if policy_config else None,
+            environment=None if overlays else environments[0],
+        )
     except Exception as e:
-        console.print(f"[red]Error writing files:[/red] {e}")
+        console.print(f"[red]Error reading policy config:[/red] {e}")
+        raise typer.Exit(code=1)
+
+    if validator_backend not in ("kubeconform", "native"):
+        console.print(f"[red]Unknown validator:[/red] {validator_backend} (expected kubeconform or native)")
+        raise typer.Exit(code=1)
+    if backend not in ("auto", "template", "llm"):
+        console.print(f"[red]Unknown backend:[/red] {backend} (expected auto, template or llm)")
         raise typer.Exit(code=1)
 
-    # 4. Validate
-    validator = K8sValidator()
-    console.print("\n[bold]Running Validation (kubeconform)...[/bold]")
-    res = validator.validate(output)
+    tracer = get_tracer()
+    tracer.enabled = profile or trace_file is not None
+    try:
+        with tracer.span("cli.generate", environment=",".join(environments), stream=stream, validator=validator_backend):
+            # With '-o -' stdout carries the YAML stream, so status output moves to stderr
+            to_stdout = output == "-"
+            single_file = single_file or to_stdout
+            if to_stdout:
+                console.stderr = True
+
+            console.print(Panel(f"Generating resources for: [bold]{prompt}[/bold]", title="DevOps CLI"))
+
+            # 1. Build Request
+            # With several environments an environment-neutral base is generated once and overlays derive the rest
+            req = GenerationRequest(
+                prompt=prompt,
+                environment=None if overlays else environments[0],
+                namespace=namespace,
+                expose=expose,
+                expose_type=expose_type,
+                image=image,
+                ports=ports or [],
+            )
+            if replicas is not None:
+                req.replicas = replicas  # marks the field as explicitly set
+
+            # 2. Generator (local template or LLM)
+            cache = None if no_cache else ResponseCache()
+            backends = [] if backend == "llm" else [TemplateBackend()]
+            generator = K8sGenerator(LLMClient(cache=cache, refresh_cache=refresh_cache), backends=backends)
+            # --backend template resolves the request up front; the result is reused below
+            templated = generator.try_backends(req) if backend == "template" else None
+            if backend == "template" and templated is None:
+                console.print("[red]No template matches this prompt.[/red] Use --backend auto or llm.")
+                raise typer.Exit(code=1)
+            try:
+                renderer = YamlRenderer()
+                if backend == "llm":
+                    console.print("[yellow]Wait... Contacting OpenAI...[/yellow]")
+                else:
+                    console.print("[yellow]Wait... Generating (local templates first, then OpenAI)...[/yellow]")
+                if stream:
+                    # 2+3. Render each resource while later ones are still being generated
+                    files = []
+                    streamed = []
+                    source = templated.resources if templated is not None else generator.generate_stream(req)
+                    for resource in source:
+                        if profiles_file:
+                            resource = apply_profile(K8sResourceList(resources=[resource]), profiles[0]).resources[0]
+                        streamed.append(resource)
+                        if to_stdout:
+                            sys.stdout.write(renderer.document(resource))
+                            sys.stdout.flush()
+                            target = "stdout"
+                        elif single_file:
+                            target = output  # bundle is written once the stream completes
+                        else:
+                            target = renderer.render_resource(resource, output, incremental=incremental)
+                            files.append(target)
+                        console.print(f" [green]+[/green] {resource.kind}/{resource.metadata.name} -> {target}")
+                    resources = K8sResourceList(resources=streamed)
+                    console.print(f"[green]Successfully generated {len(streamed)} resources![/green] (backend: {generator.last_backend})")
+                else:
+                    resources = templated if templated is not None else generator.generate(req)
+                    if profiles_file and not overlays:
+                        resources = apply_profile(resources, profiles[0])
+                    console.print(f"[green]Successfully generated {len(resources.resources)} resources![/green] (backend: {generator.last_backend})")
+                if cache is not None and generator.last_backend == "llm":
+                    stats = cache.stats
+                    console.print(f"[dim]Cache: {stats['hits']} hit(s), {stats['misses']} miss(es), {stats['writes']} write(s)[/dim]")
+            except Exception as e:
+                console.print(f"[red]Error generating resources:[/red] {e}")
+                # In a real app we might want to check for OPENAI_API_KEY specifically
+                if "OPENAI_API_KEY" not in os.environ:
+                     console.print("[bold red]Tip:[/bold red] Make sure OPENAI_API_KEY is set.")
+                raise typer.Exit(code=1)
+
+            # 3. Enforce best-practice policies in memory, fixing locally instead of re-prompting
+            if policy:
+                console.print("\n[bold]Checking policies...[/bold]")
+                policy_result = engine.check(resources, fix=fix)
+                report_policy(policy_result, fix)
+                if stream and not to_stdout and not single_file and policy_result.fixed_count:
+                    # Streamed files were written before the fixes; rewrite the changed ones
+                    files = renderer.render(resources, output, incremental=True)
+                if strict_policy and not policy_result.valid:
+                    if stream:
+                        console.print("[red]Policy errors remain in the streamed manifests.[/red]")
+                    else:
+                        console.print("[red]Policy errors remain; nothing was written (--strict-policy).[/red]")
+                    if not fix and any(v.fixable and v.severity == "error" for v in policy_result.violations):
+                        console.print("Run with --fix to repair the fixable ones.")
+                    raise typer.Exit(code=1)
+
+            # 4. Validate in memory before anything is written (native backend)
+            res = None
+            if validator_backend == "native":
+                native = NativeValidator(kubernetes_version=k8s_version, schema_location=schema_location)
+                console.print(f"\n[bold]Running Validation (native, Kubernetes {native.kubernetes_version})...[/bold]")
+                if overlays:
+                    # Each environment's variant, as its overlay would build it
+                    res = ValidationResult(valid=True)
+                    for env_profile in profiles:
+                        env_res = native.validate(apply_profile(resources, env_profile))
+                        res.valid = res.valid and env_res.valid
+                        res.errors += [f"[{env_profile.name}] {err}" for err in env_res.errors]
+                        res.issues += env_res.issues
+                        res.resource_count += env_res.resource_count
+                else:
+                    res = native.validate(resources)
+
+            # 5. Render
+            try:
+                if to_stdout:
+                    if not stream:
+                        renderer.render_stream(resources, sys.stdout)
+                    files = []
+                elif single_file:
+                    files = [renderer.render_bundle(resources, output, incremental=incremental)]
+                elif overlays:
+                    files = renderer.render_overlays(resources, output, profiles, incremental=incremental, prune=prune)
+                elif not stream:
+                    files = renderer.render(resources, output, incremental=incremental, prune=prune)
+                elif incremental or prune:
+                    renderer.update_index(output, files, prune=prune)
+
+                if not to_stdout:
+                    stats = renderer.stats
+                    console.print(
+                        f"Written {stats['written']} file(s) to [bold]{output}[/bold]"
+                        f" ({stats['unchanged']} unchanged, {stats['pruned']} pruned)"
+                    )
+                    if not stream:
+                        for f in files:
+                            console.print(f" - {f}")
+            except Exception as e:
+                console.print(f"[red]Error writing files:[/red] {e}")
+                raise typer.Exit(code=1)
+
+            # 6. Validate written files (kubeconform backend)
+            if res is None and not to_stdout:
+                validator = K8sValidator(kubernetes_version=k8s_version)
+                console.print("\n[bold]Running Validation (kubeconform)...[/bold]")
+                # Overlays only change labels, namespace, replicas and resources: validate the base once
+                res = validator.validate(os.path.join(output, "base") if overlays else output)
     
-    if res.valid:
-        console.print("[green]Validation Passed![/green]")
-    else:
-        console.print("[red]Validation Failed![/red]")
-        for err in res.errors:
-            console.print(err)
-        console.print("[yellow]Note: Validation failure doesn't delete the files. Check output dir.[/yellow]")
-
-    console.print(Panel("Done!", style="green"))
+            if res is None:
+                console.print("[yellow]Skipping kubeconform validation for stdout output (use --validator native).[/yellow]")
+            elif res.valid:
+                console.print("[green]Validation Passed![/green]")
+            else:
+                console.print("[red]Validation Failed![/red]")
+                for err in res.errors:
+                    console.print(err)
+                console.print("[yellow]Note: Validation failure doesn't delete the files. Check output dir.[/yellow]")
+
+            console.print(Panel("Done!", style="green"))
+    finally:
+        report_trace(tracer, profile, trace_file)
+
+
+@k8s_app.command("generate-batch")
+def generate_batch(
+    file: str = typer.Option(..., "--file", "-f", help="JSONL or YAML file of generation requests"),
+    output: str = typer.Option("./k8s", "--output", "-o", help="Output root; each item gets its own sub-directory"),
+    concurrency: int = typer.Option(DEFAULT_CONCURRENCY, "--concurrency", "-c", help="Maximum concurrent OpenAI requests"),
+    validate: bool = typer.Option(True, "--validate/--no-validate", help="Run kubeconform on each item's output"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the on-disk LLM response cache"),
+    refresh_cache: bool = typer.Option(False, "--refresh-cache", help="Ignore cached responses but store the fresh ones"),
+    backend: str = typer.Option("auto", "--backend", help="Generator backend: auto (local templates, then OpenAI) or llm"),
+    profile: bool = typer.Option(False, "--profile", help="Print per-stage timings and token usage"),
+    trace_file: Optional[str] = typer.Option(None, "--trace-file", help="Write a Chrome trace-event JSON file of the run")
+):
+    """
+    Generate Kubernetes manifests for many requests concurrently.
+    """
+    from rich.table import Table
+    from devops_cli.cache import ResponseCache
+    from devops_cli.llm_client import LLMClient
+    from devops_cli.generators.k8s_generator import K8sGenerator
+    from devops_cli.generators.batch import BatchGenerator, load_batch_file
+    from devops_cli.generators.templates import TemplateBackend
+    from devops_cli.renderers.yaml_renderer import YamlRenderer
+    from devops_cli.validators.k8s_validator import K8sValidator
+
+    if backend not in ("auto", "llm"):
+        console.print(f"[red]Unknown backend:[/red] {backend} (expected auto or llm)")
+        raise typer.Exit(code=1)
+
+    try:
+        items = load_batch_file(file)
+    except Exception as e:
+        console.print(f"[red]Error reading batch file:[/red] {e}")
+        raise typer.Exit(code=1)
+
+    console.print(Panel(f"Generating [bold]{len(items)}[/bold] requests (concurrency {concurrency})", title="DevOps CLI"))
+
+    cache = None if no_cache else ResponseCache()
+    batch = BatchGenerator(
+        K8sGenerator(
+            LLMClient(cache=cache, refresh_cache=refresh_cache),
+            backends=[] if backend == "llm" else [TemplateBackend()],
+        ),
+        YamlRenderer(),
+        K8sValidator() if validate else None,
+        concurrency=concurrency,
+    )
+    tracer = get_tracer()
+    tracer.enabled = profile or trace_file is not None
+    start = time.perf_counter()
+    try:
+        with tracer.span("cli.generate_batch", items=len(items), concurrency=concurrency):
+            results = batch.run(items, output)
+    finally:
+        report_trace(tracer, profile, trace_file)
+    elapsed = time.perf_counter() - start
+
+    table = Table(title="Batch summary")
+    table.add_column("Item")
+    table.add_column("Status")
+    table.add_column("Resources", justify="right")
+    table.add_column("Validation")
+    table.add_column("Time (s)", justify="right")
+    table.add_column("Output / Error")
+    for r in results:
+        if r.validation is None:
+            validation = "-"
+        else:
+            validation = "[green]passed[/green]" if r.validation.valid else "[red]failed[/red]"
+        table.add_row(
+            r.name,
+            "[green]ok[/green]" if r.success else "[red]failed[/red]",
+            str(r.resource_count),
+            validation,
+            f"{r.duration:.2f}",
+            r.output_dir if r.success else r.error,
+        )
+    console.print(table)
+
+    failed = sum(1 for r in results if not r.success)
+    console.print(f"{len(results) - failed}/{len(results)} succeeded in {elapsed:.2f}s")
+    if failed:
+        raise typer.Exit(code=1)
+
+
+@k8s_app.command()
+def lint(
+    path: str = typer.Argument(..., help="Manifest file or directory to check"),
+    fix: bool = typer.Option(False, "--fix", help="Repair fixable violations and rewrite the affected files"),
+    env: Optional[str] = typer.Option(None, "--env", "-e", help="Environment label to add when --fix finds it missing"),
+    policy_config: Optional[str] = typer.Option(None, "--policy-config", help="YAML/JSON file of per-rule severities (error, warning, info, off)"),
+    profile: bool = typer.Option(False, "--profile", help="Print per-stage timings"),
+    trace_file: Optional[str] = typer.Option(None, "--trace-file", help="Write a Chrome trace-event JSON file of the run")
+):
+    """
+    Check existing manifests against the best-practice policies.
+    """
+    from devops_cli.validators.policy import PolicyEngine, lint_directory, load_policy_config
+
+    if not os.path.exists(path):
+        console.print(f"[red]No such file or directory:[/red] {path}")
+        raise typer.Exit(code=1)
+    try:
+        engine = PolicyEngine(severities=load_policy_config(policy_config) if policy_config else None, environment=env)
+    except Exception as e:
+        console.print(f"[red]Error reading policy config:[/red] {e}")
+        raise typer.Exit(code=1)
+
+    tracer = get_tracer()
+    tracer.enabled = profile or trace_file is not None
+    try:
+        with tracer.span("cli.lint", path=path, fix=fix):
+            result = lint_directory(engine, path, fix=fix)
+    finally:
+        report_trace(tracer, profile, trace_file)
+
+    report_policy(result, fix)
+    if not result.valid:
+        raise typer.Exit(code=1)
+
+
+@k8s_app.command()
+def cache(
+    clear: bool = typer.Option(False, "--clear", help="Remove all cached LLM responses")
+):
+    """
+    Show (or clear) the on-disk LLM response cache.
+    """
+    from devops_cli.cache import ResponseCache
+
+    response_cache = ResponseCache()
+    if clear:
+        response_cache.clear()
+        console.print("[green]Cache cleared.[/green]")
+    info = response_cache.info()
+    console.print(f"Cache directory: [bold]{info['directory']}[/bold]")
+    console.print(f"Entries: {info['entries']} ({info['bytes']} bytes)")
+
+@app.command()
+def serve(
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to listen on"),
+    port: int = typer.Option(8080, "--port", help="Port to listen on"),
+    concurrency: int = typer.Option(DEFAULT_CONCURRENCY, "--concurrency", "-c", help="Maximum requests processed at once"),
+    max_pending: Optional[int] = typer.Option(None, "--max-pending", help="Requests allowed to wait for a slot before 503 (default 4x concurrency)"),
+    backend: str = typer.Option("auto", "--backend", help="Generator backend: auto (local templates, then OpenAI) or llm"),
+    validator_backend: str = typer.Option("kubeconform", "--validator", help="Default validation backend (kubeconform, native)"),
+    k8s_version: Optional[str] = typer.Option(None, "--k8s-version", help="Kubernetes version to validate against"),
+    schema_location: Optional[str] = typer.Option(None, "--schema-location", help="Local schema bundle directory for the native validator"),
+    policy_config: Optional[str] = typer.Option(None, "--policy-config", help="YAML/JSON file of per-rule severities"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the on-disk LLM response cache"),
+):
+    """
+    Run a long-lived HTTP API for generate, render and validate with warm clients.
+    """
+    from devops_cli.cache import ResponseCache
+    from devops_cli.llm_client import LLMClient
+    from devops_cli.generators.templates import TemplateBackend
+    from devops_cli.server import DevopsServer
+    from devops_cli.validators.k8s_validator import K8sValidator
+    from devops_cli.validators.native_validator import NativeValidator
+    from devops_cli.validators.policy import PolicyEngine, load_policy_config
+
+    if backend not in ("auto", "llm"):
+        console.print(f"[red]Unknown backend:[/red] {backend} (expected auto or llm)")
+        raise typer.Exit(code=1)
+    if validator_backend not in ("kubeconform", "native"):
+        console.print(f"[red]Unknown validator:[/red] {validator_backend} (expected kubeconform or native)")
+        raise typer.Exit(code=1)
+    try:
+        severities = load_policy_config(policy_config) if policy_config else None
+        PolicyEngine(severities=severities)  # fail at start-up, not on the first request
+    except Exception as e:
+        console.print(f"[red]Error reading policy config:[/red] {e}")
+        raise typer.Exit(code=1)
+
+    server = DevopsServer(
+        llm_client=LLMClient(cache=None if no_cache else ResponseCache()),
+        backends=[] if backend == "llm" else [TemplateBackend()],
+        validator=K8sValidator(kubernetes_version=k8s_version) if validator_backend == "kubeconform" else None,
+        native_validator=NativeValidator(kubernetes_version=k8s_version, schema_location=schema_location),
+        policy_severities=severities,
+        concurrency=concurrency,
+        max_pending=max_pending,
+    )
+    console.print(Panel(
+        f"Serving on [bold]http://{host}:{port}[/bold] (concurrency {server.concurrency}, validator {validator_backend})",
+        title="DevOps CLI",
+    ))
+    server.run(host, port)
+
 
 if __name__ == "__main__":
     app()
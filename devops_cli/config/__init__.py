@@ -0,0 +1,18 @@
+import os
+
+# Defaults shared by the CLI and the modules it loads lazily. Kept here so
+# building the CLI (e.g. for --help) doesn't import openai, pydantic or ruamel.
+DEFAULT_CONCURRENCY = 8
+DEFAULT_KUBERNETES_VERSION = "1.29.0"
+
+
+def cache_dir(*parts: str) -> str:
+    """
+    Returns the devops-cli cache directory (optionally a sub-directory of it).
+    Honours DEVOPS_CLI_CACHE_DIR, then XDG_CACHE_HOME, then ~/.cache.
+    """
+    base = os.getenv("DEVOPS_CLI_CACHE_DIR")
+    if not base:
+        xdg = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        base = os.path.join(xdg, "devops-cli")
+    return os.path.join(base, *parts)
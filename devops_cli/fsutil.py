@@ -0,0 +1,22 @@
+import os
+import tempfile
+
+
+def atomic_write(path: str, data: str) -> None:
+    """
+    Writes data to path via a temp file in the same directory plus os.replace,
+    so readers (including other CLI processes) never see a half-written file.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
@@ -0,0 +1,17 @@
+from typing import Optional
+from devops_cli.models.internal import GenerationRequest
+from devops_cli.models.k8s import K8sResourceList
+
+
+class GeneratorBackend:
+    """
+    A local way of answering a GenerationRequest without the LLM.
+
+    K8sGenerator tries its backends in order before falling back to OpenAI;
+    a backend returns None when it cannot answer the request confidently.
+    """
+
+    name = "backend"
+
+    def generate(self, request: GenerationRequest) -> Optional[K8sResourceList]:
+        raise NotImplementedError
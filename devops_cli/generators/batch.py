@@ -0,0 +1,152 @@
+import os
+import re
+import json
+import time
+import asyncio
+from typing import List, Optional, Union
+from pydantic import ValidationError
+from ruamel.yaml import YAML
+from devops_cli.config import DEFAULT_CONCURRENCY
+from devops_cli.models.internal import BatchItem, BatchItemResult
+from devops_cli.generators.k8s_generator import K8sGenerator
+from devops_cli.renderers.yaml_renderer import YamlRenderer
+from devops_cli.validators.k8s_validator import K8sValidator
+
+
+class InvalidBatchEntry:
+    """
+    An entry of the batch file that is not a valid request. It is reported as
+    a failed item instead of aborting the batch.
+    """
+
+    prompt = "invalid"
+
+    def __init__(self, error: str, name: Optional[str] = None):
+        self.error = error
+        self.name = name
+
+
+def load_batch_file(path: str) -> List[Union[BatchItem, InvalidBatchEntry]]:
+    """
+    Loads generation requests from a manifest file.
+    .yaml/.yml files hold a list of requests (or a mapping with a 'requests' key);
+    anything else is read as JSONL, one request per line. Entries that do not
+    parse or validate come back as InvalidBatchEntry.
+    """
+    entries: list = []
+    with open(path) as f:
+        if path.endswith((".yaml", ".yml")):
+            data = YAML(typ="safe").load(f) or []
+            if isinstance(data, dict):
+                data = data.get("requests", [])
+            entries = list(data)
+        else:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except ValueError as e:
+                    entries.append(InvalidBatchEntry(f"line {number}: invalid JSON: {e}"))
+
+    items: List[Union[BatchItem, InvalidBatchEntry]] = []
+    for entry in entries:
+        if isinstance(entry, InvalidBatchEntry):
+            items.append(entry)
+            continue
+        try:
+            items.append(BatchItem.model_validate(entry))
+        except ValidationError as e:
+            name = entry.get("name") if isinstance(entry, dict) and isinstance(entry.get("name"), str) else None
+            items.append(InvalidBatchEntry(f"invalid request: {e}", name=name))
+    return items
+
+
+def item_dir_name(item: Union[BatchItem, InvalidBatchEntry], index: int) -> str:
+    if item.name:
+        base = item.name
+    else:
+        base = f"{index:03d}-{item.prompt[:40]}"
+    return re.sub(r"[^A-Za-z0-9._-]+", "-", base).strip("-").lower() or f"{index:03d}"
+
+
+class BatchGenerator:
+    """
+    Runs many GenerationRequests concurrently on the async OpenAI client.
+    Each item renders into its own sub-directory; a failing item is recorded
+    in its result and never aborts the rest of the batch. `generator` supplies
+    the shared LLM client and backends; every item runs on its own
+    K8sGenerator so last_backend stays item-local.
+    """
+
+    def __init__(
+        self,
+        generator: K8sGenerator,
+        renderer: YamlRenderer,
+        validator: Optional[K8sValidator] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ):
+        self.generator = generator
+        self.renderer = renderer
+        self.validator = validator
+        self.concurrency = max(1, concurrency)
+
+    async def _run_item(
+        self, item: Union[BatchItem, InvalidBatchEntry], name: str, output_root: str, semaphore: asyncio.Semaphore
+    ) -> BatchItemResult:
+        output_dir = os.path.join(output_root, name)
+        if isinstance(item, InvalidBatchEntry):
+            return BatchItemResult(name=name, success=False, output_dir=output_dir, error=item.error)
+
+        start = time.perf_counter()
+        generator = K8sGenerator(self.generator.llm_client, backends=self.generator.backends)
+        try:
+            async with semaphore:
+                resources = await generator.agenerate(item)
+            # Rendering stays on the event loop: it takes milliseconds and the
+            # shared ruamel YAML instance is not safe to use from several threads
+            files = self.renderer.render(resources, output_dir)
+            validation = None
+            if self.validator is not None:
+                validation = await asyncio.to_thread(self.validator.validate, output_dir)
+            return BatchItemResult(
+                name=name,
+                success=True,
+                output_dir=output_dir,
+                backend=generator.last_backend,
+                resource_count=len(resources.resources),
+                files_generated=files,
+                validation=validation,
+                duration=time.perf_counter() - start,
+            )
+        except Exception as e:
+            return BatchItemResult(
+                name=name,
+                success=False,
+                output_dir=output_dir,
+                duration=time.perf_counter() - start,
+                error=str(e) or type(e).__name__,
+            )
+
+    async def arun(self, items: List[Union[BatchItem, InvalidBatchEntry]], output_root: str) -> List[BatchItemResult]:
+        names = []
+        for i, item in enumerate(items):
+            name = item_dir_name(item, i)
+            if name in names:
+                name = f"{name}-{i:03d}"
+            names.append(name)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        return await asyncio.gather(
+            *(self._run_item(item, name, output_root, semaphore) for item, name in zip(items, names))
+        )
+
+    def run(self, items: List[Union[BatchItem, InvalidBatchEntry]], output_root: str) -> List[BatchItemResult]:
+        async def main():
+            try:
+                return await self.arun(items, output_root)
+            finally:
+                # The async client's connection pool is tied to this event loop
+                await self.generator.llm_client.aclose()
+
+        return asyncio.run(main())
@@ -1,7 +1,11 @@
 import json
+from typing import Iterator, List, Optional
+from pydantic import ValidationError
 from devops_cli.models.internal import GenerationRequest
-from devops_cli.models.k8s import K8sResourceList
+from devops_cli.models.k8s import K8sResource, K8sResourceAdapter, K8sResourceList
 from devops_cli.llm_client import LLMClient
+from devops_cli.generators.backends import GeneratorBackend
+from devops_cli.telemetry import span
 
 SYSTEM_PROMPT = """
 You are an expert Kubernetes Helper.
@@ -29,26 +33,100 @@ Ensure you follow these best practices:
 """
 
 class K8sGenerator:
-    def __init__(self):
-        self.llm_client = LLMClient()
+    def __init__(self, llm_client: Optional[LLMClient] = None, backends: Optional[List[GeneratorBackend]] = None):
+        self.llm_client = llm_client or LLMClient()
+        self.backends = backends or []  # tried in order before the LLM
+        self.last_backend: Optional[str] = None  # which backend answered the last request
 
-    def generate(self, request: GenerationRequest) -> K8sResourceList:
-        user_prompt = f"""
+    def build_user_prompt(self, request: GenerationRequest) -> str:
+        # Optional fields are only added when set so existing prompts (and cache keys) stay the same
+        extra = ""
+        if request.image:
+            extra += f"Image: {request.image}\n        "
+        if request.ports:
+            extra += f"Ports: {', '.join(str(p) for p in request.ports)}\n        "
+        if "replicas" in request.model_fields_set:
+            extra += f"Replicas: {request.replicas}\n        "
+        if request.environment:
+            environment = request.environment
+        else:
+            environment = "none (shared base for several environments; leave out the environment label)"
+        return f"""
         Request: {request.prompt}
-        Environment: {request.environment}
+        Environment: {environment}
         Namespace: {request.namespace}
         Expose Service: {request.expose} (Type: {request.expose_type})
-        
+        {extra}
         Generate the necessary Kubernetes resources (Deployment, Service, ConfigMap, etc.).
         """
-        
-        raw_response = self.llm_client.generate_resources(SYSTEM_PROMPT, user_prompt)
-        
+
+    def try_backends(self, request: GenerationRequest) -> Optional[K8sResourceList]:
+        for backend in self.backends:
+            with span("generator.backend", backend=backend.name) as trace_span:
+                try:
+                    resources = backend.generate(request)
+                except ValidationError as e:
+                    # A request the backend cannot build valid models for goes to the next one
+                    trace_span.set("error", str(e).splitlines()[0])
+                    resources = None
+                trace_span.set("matched", resources is not None)
+            if resources is not None:
+                self.last_backend = backend.name
+                return resources
+        self.last_backend = "llm"
+        return None
+
+    def parse_response(self, raw_response: dict) -> K8sResourceList:
         # Validate with Pydantic
         try:
-            validated_resources = K8sResourceList.model_validate(raw_response)
+            with span("generator.validate_models") as trace_span:
+                validated_resources = K8sResourceList.model_validate(raw_response)
+                trace_span.set("resource_count", len(validated_resources.resources))
             return validated_resources
         except Exception as e:
             print("Failed to validate response against Pydantic models.")
             print(f"Raw response: {json.dumps(raw_response, indent=2)}")
             raise e
+
+    def generate(self, request: GenerationRequest) -> K8sResourceList:
+        with span("generator.generate") as trace_span:
+            resources = self.try_backends(request)
+            trace_span.set("backend", self.last_backend)
+            if resources is not None:
+                trace_span.set("resource_count", len(resources.resources))
+                return resources
+            user_prompt = self.build_user_prompt(request)
+            # Parsed inside the client so a response that fails validation is never cached
+            resources = self.llm_client.generate_resources(SYSTEM_PROMPT, user_prompt, parse=self.parse_response)
+            trace_span.set("resource_count", len(resources.resources))
+            return resources
+
+    async def agenerate(self, request: GenerationRequest) -> K8sResourceList:
+        with span("generator.agenerate") as trace_span:
+            resources = self.try_backends(request)
+            trace_span.set("backend", self.last_backend)
+            if resources is not None:
+                trace_span.set("resource_count", len(resources.resources))
+                return resources
+            user_prompt = self.build_user_prompt(request)
+            resources = await self.llm_client.agenerate_resources(SYSTEM_PROMPT, user_prompt, parse=self.parse_response)
+            trace_span.set("resource_count", len(resources.resources))
+            return resources
+
+    def generate_stream(self, request: GenerationRequest) -> Iterator[K8sResource]:
+        """
+        Yields each resource, validated, as soon as the model finishes emitting it.
+        """
+        resources = self.try_backends(request)
+        if resources is not None:
+            yield from resources.resources
+            return
+
+        user_prompt = self.build_user_prompt(request)
+        for raw_resource in self.llm_client.stream_resources(SYSTEM_PROMPT, user_prompt, parse=self.parse_response):
+            try:
+                yield K8sResourceAdapter.validate_python(raw_resource)
+            except Exception as e:
+                print("Failed to validate streamed resource against Pydantic models.")
+                print(f"Raw resource: {json.dumps(raw_resource, indent=2)}")
+                raise e
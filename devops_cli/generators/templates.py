@@ -0,0 +1,204 @@
+import re
+from typing import Dict, List, Optional
+from devops_cli.generators.backends import GeneratorBackend
+from devops_cli.models.internal import GenerationRequest
+from devops_cli.models.k8s import (
+    Container,
+    ContainerPort,
+    ContainerProbe,
+    DeploymentSpec,
+    K8sConfigMap,
+    K8sDeployment,
+    K8sMetadata,
+    K8sResourceList,
+    K8sService,
+    LabelSelector,
+    PodSpec,
+    PodTemplateMetadata,
+    PodTemplateSpec,
+    ServicePort,
+    ServiceSpec,
+    default_resources,
+)
+
+
+class Workload:
+    def __init__(self, image: str, port: int, http_path: Optional[str] = None, config: Optional[Dict[str, str]] = None):
+        self.image = image
+        self.port = port
+        self.http_path = http_path  # None means a TCP probe
+        self.config = config or {}
+
+
+# Well-known images that run with no extra setup (no mandatory passwords etc.)
+WORKLOADS: Dict[str, Workload] = {
+    "nginx": Workload("nginx:1.25", 80, http_path="/"),
+    "httpd": Workload("httpd:2.4", 80, http_path="/"),
+    "redis": Workload("redis:7.2", 6379, config={"maxmemory": "256mb", "maxmemory-policy": "allkeys-lru"}),
+    "memcached": Workload("memcached:1.6", 11211),
+    "mongodb": Workload("mongo:7.0", 27017),
+    "rabbitmq": Workload("rabbitmq:3.13-management", 5672),
+}
+ALIASES = {"apache": "httpd", "mongo": "mongodb"}
+
+NUMBER_WORDS = {"one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10}
+SERVICE_TYPES = {"clusterip": "ClusterIP", "nodeport": "NodePort", "loadbalancer": "LoadBalancer"}
+
+# Words that carry no meaning for these templates
+FILLER = {
+    "a", "an", "the", "with", "and", "for", "of", "on", "in", "as", "to", "at", "by", "using", "via", "that", "has", "having",
+    "simple", "basic", "standard", "default", "single", "deployment", "deploy", "app", "application",
+    "server", "container", "instance", "k8s", "kubernetes", "manifest", "manifests", "it", "plus",
+}
+REPLICA_WORDS = {"replica", "replicas", "instances", "pods", "copies"}
+SERVICE_WORDS = {"service", "svc", "expose", "exposed", "exposing"}
+CONFIGMAP_WORDS = {"configmap", "configmaps", "config-map"}
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9._:/@-]*", re.IGNORECASE)
+# Names become metadata.name, container names and file names: DNS-1123 labels only
+NAME_RE = re.compile(r"[a-z0-9]([-a-z0-9]{0,61}[a-z0-9])?")
+
+
+class TemplateMatch:
+    def __init__(self):
+        self.workload: Optional[str] = None
+        self.name: Optional[str] = None
+        self.replicas: Optional[int] = None
+        self.ports: List[int] = []
+        self.image: Optional[str] = None
+        self.configmap = False
+        self.service = False
+        self.service_type: Optional[str] = None
+
+
+def match_prompt(prompt: str) -> Optional[TemplateMatch]:
+    """
+    Parses a prompt like "nginx deployment with 2 replicas and a service".
+    Every word must be understood and exactly one known workload named,
+    otherwise None is returned and the request goes to the LLM.
+    """
+    # Keywords match case-insensitively; image references keep their case
+    raw_tokens = TOKEN_RE.findall(prompt)
+    tokens = [tok.lower() for tok in raw_tokens]
+    m = TemplateMatch()
+    i = 0
+    while i < len(tokens):
+        tok = tokens[i]
+        nxt = tokens[i + 1] if i + 1 < len(tokens) else None
+        number = int(tok) if tok.isdigit() else NUMBER_WORDS.get(tok)
+
+        if tok in WORKLOADS or tok in ALIASES:
+            workload = ALIASES.get(tok, tok)
+            if m.workload and m.workload != workload:
+                return None  # several workloads: beyond a simple template
+            m.workload = workload
+        elif number is not None and nxt in REPLICA_WORDS:
+            m.replicas = number
+            i += 1
+        elif tok in REPLICA_WORDS and nxt is not None and (nxt.isdigit() or nxt in NUMBER_WORDS):
+            m.replicas = int(nxt) if nxt.isdigit() else NUMBER_WORDS[nxt]
+            i += 1
+        elif tok in ("port", "ports") and nxt is not None and nxt.isdigit():
+            m.ports.append(int(nxt))
+            i += 1
+        elif tok == "image" and nxt is not None:
+            m.image = raw_tokens[i + 1]
+            i += 1
+        elif tok in ("named", "called") and nxt is not None:
+            if not NAME_RE.fullmatch(raw_tokens[i + 1]):
+                return None  # not a valid resource name: let the LLM interpret it
+            m.name = nxt
+            i += 1
+        elif tok in CONFIGMAP_WORDS or (tok == "config" and nxt == "map"):
+            m.configmap = True
+            if tok == "config":
+                i += 1
+        elif tok in SERVICE_WORDS:
+            m.service = True
+        elif tok in SERVICE_TYPES:
+            m.service = True
+            m.service_type = SERVICE_TYPES[tok]
+        elif tok not in FILLER:
+            return None
+        i += 1
+
+    if m.workload is None:
+        return None
+    return m
+
+
+class TemplateBackend(GeneratorBackend):
+    """
+    Deterministic local generator for common single-workload prompts.
+    Builds the K8sResourceList directly from the models, no network needed.
+    """
+
+    name = "template"
+
+    def generate(self, request: GenerationRequest) -> Optional[K8sResourceList]:
+        m = match_prompt(request.prompt)
+        if m is None:
+            return None
+
+        workload = WORKLOADS[m.workload]
+        name = m.name or m.workload
+        image = request.image or m.image or workload.image
+        ports = request.ports or m.ports or [workload.port]
+        # An explicit --replicas wins over a count in the prompt
+        if "replicas" in request.model_fields_set or m.replicas is None:
+            replicas = request.replicas
+        else:
+            replicas = m.replicas
+
+        labels = {"app": name}
+        if request.environment:
+            labels["environment"] = request.environment
+
+        def metadata(resource_name: str) -> K8sMetadata:
+            return K8sMetadata(name=resource_name, namespace=request.namespace, labels=dict(labels))
+
+        probe_port = ports[0]
+        if workload.http_path:
+            probe = ContainerProbe(httpGet={"path": workload.http_path, "port": probe_port})
+        else:
+            probe = ContainerProbe(tcpSocket={"port": probe_port})
+
+        container = Container(
+            name=name,
+            image=image,
+            ports=[ContainerPort(containerPort=p) for p in ports],
+            resources=default_resources(),
+            readinessProbe=probe,
+            livenessProbe=probe.model_copy(update={"initialDelaySeconds": 15}),
+            securityContext={"allowPrivilegeEscalation": False},
+        )
+
+        resources = []
+        if m.configmap:
+            config_name = f"{name}-config"
+            resources.append(K8sConfigMap(metadata=metadata(config_name), data=dict(workload.config)))
+            container = container.model_copy(update={"envFrom": [{"configMapRef": {"name": config_name}}]})
+
+        resources.append(K8sDeployment(
+            metadata=metadata(name),
+            spec=DeploymentSpec(
+                replicas=replicas,
+                selector=LabelSelector(matchLabels={"app": name}),
+                template=PodTemplateSpec(
+                    metadata=PodTemplateMetadata(labels=dict(labels)),
+                    spec=PodSpec(containers=[container]),
+                ),
+            ),
+        ))
+
+        if request.expose or m.service:
+            resources.append(K8sService(
+                metadata=metadata(name),
+                spec=ServiceSpec(
+                    selector={"app": name},
+                    ports=[ServicePort(port=p, targetPort=p, name=f"port-{p}") for p in ports],
+                    type=m.service_type or request.expose_type,
+                ),
+            ))
+
+        return K8sResourceList(resources=resources)
@@ -1,35 +1,274 @@
 import os
 import json
-import openai
-from devops_cli.models.k8s import K8sResourceList
+import time
+import random
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Tuple
+from devops_cli.cache import ResponseCache
+from devops_cli.streaming import ResourceStreamParser
+from devops_cli.telemetry import span
+
+if TYPE_CHECKING:
+    import openai
+
+DEFAULT_MODEL = "gpt-4-1106-preview"  # Using a model capable of good JSON generation
+DEFAULT_TEMPERATURE = 0.2  # Low temperature for more deterministic/structured output
+RESPONSE_FORMAT = {"type": "json_object"}
+
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0  # seconds
+BACKOFF_MAX = 30.0  # seconds
+
+
+def retry_delay(exc: Exception, attempt: int) -> Optional[float]:
+    """
+    Returns how long to wait before retrying after exc, or None if the error
+    is not worth retrying. Rate limits (429), server errors (5xx) and
+    connection problems are retried; Retry-After is honoured when present.
+    """
+    import openai
+
+    if isinstance(exc, openai.APIStatusError):
+        if exc.status_code != 429 and exc.status_code < 500:
+            return None
+        retry_after = exc.response.headers.get("retry-after") if exc.response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), BACKOFF_MAX)
+            except ValueError:
+                pass
+    elif not isinstance(exc, openai.APIConnectionError):
+        return None
+
+    # Exponential backoff with full jitter
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
 
 class LLMClient:
-    def __init__(self, api_key: str = None):
+    def __init__(
+        self,
+        api_key: str = None,
+        model: str = DEFAULT_MODEL,
+        temperature: float = DEFAULT_TEMPERATURE,
+        cache: Optional[ResponseCache] = None,
+        refresh_cache: bool = False,
+        base_url: Optional[str] = None,
+        max_retries: int = MAX_RETRIES,
+    ):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.model = model
+        self.temperature = temperature
+        self.cache = cache
+        self.refresh_cache = refresh_cache
+        self.base_url = base_url  # None lets openai fall back to OPENAI_BASE_URL
+        self.max_retries = max_retries
+        self._client = None
+        self._async_client = None
+
+    def _check_api_key(self):
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY environment variable not set")
-        self.client = openai.OpenAI(api_key=self.api_key)
 
-    def generate_resources(self, system_prompt: str, user_prompt: str) -> dict:
+    @property
+    def client(self) -> "openai.OpenAI":
+        # Built on first use so cache hits never need an API key, a connection
+        # pool or even the (slow to import) openai package
+        if self._client is None:
+            self._check_api_key()
+            import openai
+            # Retries are handled by us so they are visible and share one policy
+            self._client = openai.OpenAI(api_key=self.api_key, base_url=self.base_url, max_retries=0)
+        return self._client
+
+    @property
+    def async_client(self) -> "openai.AsyncOpenAI":
+        if self._async_client is None:
+            self._check_api_key()
+            import openai
+            self._async_client = openai.AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, max_retries=0)
+        return self._async_client
+
+    async def aclose(self):
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+    def _request_kwargs(self, system_prompt: str, user_prompt: str) -> dict:
+        return dict(
+            model=self.model,
+            response_format=RESPONSE_FORMAT,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=self.temperature,
+        )
+
+    def _cache_lookup(self, system_prompt: str, user_prompt: str) -> Tuple[Optional[str], Optional[dict]]:
         """
-        Generates K8s resources using OpenAI and returns the raw JSON dict.
+        Returns (cache_key, cached_response). Both are None when caching is off.
         """
+        if self.cache is None:
+            return None, None
+        cache_key = self.cache.make_key(self.model, system_prompt, user_prompt, self.temperature, RESPONSE_FORMAT)
+        if self.refresh_cache:
+            return cache_key, None
+        cached = self.cache.get(cache_key)
+        return cache_key, (json.loads(cached) if cached is not None else None)
+
+    def _cache_state(self, cached: Optional[dict]) -> str:
+        if self.cache is None:
+            return "off"
+        if cached is not None:
+            return "hit"
+        return "refresh" if self.refresh_cache else "miss"
+
+    @staticmethod
+    def _record_usage(trace_span, usage) -> None:
+        if usage is not None:
+            trace_span.add("prompt_tokens", getattr(usage, "prompt_tokens", 0) or 0)
+            trace_span.add("completion_tokens", getattr(usage, "completion_tokens", 0) or 0)
+
+    def _use_cached(self, cached: Optional[dict], cache_key: Optional[str], parse: Optional[Callable[[dict], Any]], trace_span):
+        """
+        Returns the cached response (parsed when parse is given), or None when
+        there is none or it no longer parses; such an entry is dropped.
+        """
+        if cached is None or parse is None:
+            return cached
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4-1106-preview", # Using a model capable of good JSON generation
-                response_format={"type": "json_object"},
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.2, # Low temperature for more deterministic/structured output
-            )
-            
-            content = response.choices[0].message.content
+            return parse(cached)
+        except Exception:
+            self.cache.delete(cache_key)
+            trace_span.set("cache", "invalid")
+            return None
+
+    def _handle_response(self, response, cache_key: Optional[str], parse: Optional[Callable[[dict], Any]]):
+        content = response.choices[0].message.content
+        if not content:
+            raise ValueError("Received empty response from OpenAI")
+
+        result = json.loads(content)
+        if parse is not None:
+            result = parse(result)
+        # Only responses that parsed (and validated) are worth replaying
+        if cache_key is not None:
+            self.cache.set(cache_key, content)
+        return result
+
+    def generate_resources(self, system_prompt: str, user_prompt: str, parse: Optional[Callable[[dict], Any]] = None):
+        """
+        Generates K8s resources using OpenAI and returns the raw JSON dict, or
+        parse(dict) when parse is given. Responses are served from / stored in
+        the cache when one is configured; with parse, only after it succeeds.
+        """
+        with span("llm.generate_resources", model=self.model) as trace_span:
+            cache_key, cached = self._cache_lookup(system_prompt, user_prompt)
+            trace_span.set("cache", self._cache_state(cached))
+            result = self._use_cached(cached, cache_key, parse, trace_span)
+            if result is not None:
+                return result
+
+            attempt = 0
+            while True:
+                try:
+                    response = self.client.chat.completions.create(**self._request_kwargs(system_prompt, user_prompt))
+                    break
+                except Exception as e:
+                    delay = retry_delay(e, attempt)
+                    if delay is None or attempt >= self.max_retries:
+                        print(f"Error calling OpenAI: {e}")
+                        raise
+                    attempt += 1
+                    trace_span.set("retries", attempt)
+                    time.sleep(delay)
+
+            self._record_usage(trace_span, getattr(response, "usage", None))
+            return self._handle_response(response, cache_key, parse)
+
+    async def agenerate_resources(self, system_prompt: str, user_prompt: str, parse: Optional[Callable[[dict], Any]] = None):
+        """
+        Async variant of generate_resources, used for concurrent batch generation.
+        """
+        with span("llm.agenerate_resources", model=self.model) as trace_span:
+            # Cache reads, parsing (model validation) and cache writes run in a
+            # worker thread so large responses do not stall the event loop
+            cache_key, cached = await asyncio.to_thread(self._cache_lookup, system_prompt, user_prompt)
+            trace_span.set("cache", self._cache_state(cached))
+            result = await asyncio.to_thread(self._use_cached, cached, cache_key, parse, trace_span)
+            if result is not None:
+                return result
+
+            attempt = 0
+            while True:
+                try:
+                    response = await self.async_client.chat.completions.create(**self._request_kwargs(system_prompt, user_prompt))
+                    break
+                except Exception as e:
+                    delay = retry_delay(e, attempt)
+                    if delay is None or attempt >= self.max_retries:
+                        raise
+                    attempt += 1
+                    trace_span.set("retries", attempt)
+                    await asyncio.sleep(delay)
+
+            self._record_usage(trace_span, getattr(response, "usage", None))
+            return await asyncio.to_thread(self._handle_response, response, cache_key, parse)
+
+    def stream_resources(self, system_prompt: str, user_prompt: str, parse: Optional[Callable[[dict], Any]] = None) -> Iterator[dict]:
+        """
+        Streams the completion and yields each raw resource dict as soon as it
+        is complete, instead of waiting for the whole JSON document. With
+        parse, a cached response is only replayed (and a streamed one only
+        cached) when parse accepts the whole document.
+        """
+        with span("llm.stream_resources", model=self.model) as trace_span:
+            cache_key, cached = self._cache_lookup(system_prompt, user_prompt)
+            trace_span.set("cache", self._cache_state(cached))
+            if cached is not None and self._use_cached(cached, cache_key, parse, trace_span) is not None:
+                yield from cached.get("resources", [])
+                return
+
+            attempt = 0
+            while True:
+                try:
+                    stream = self.client.chat.completions.create(
+                        stream=True,
+                        stream_options={"include_usage": True},
+                        **self._request_kwargs(system_prompt, user_prompt)
+                    )
+                    break
+                except Exception as e:
+                    delay = retry_delay(e, attempt)
+                    if delay is None or attempt >= self.max_retries:
+                        print(f"Error calling OpenAI: {e}")
+                        raise
+                    attempt += 1
+                    trace_span.set("retries", attempt)
+                    time.sleep(delay)
+
+            parser = ResourceStreamParser()
+            parts = []
+            for chunk in stream:
+                # With include_usage the final chunk carries usage and no choices
+                self._record_usage(trace_span, getattr(chunk, "usage", None))
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                parts.append(delta)
+                yield from parser.feed(delta)
+
+            content = "".join(parts)
             if not content:
                 raise ValueError("Received empty response from OpenAI")
-            
-            return json.loads(content)
-        except Exception as e:
-            print(f"Error calling OpenAI: {e}")
-            raise
+
+            parsed = json.loads(content)
+            if parser.count == 0:
+                # Safety net: the incremental parser found nothing, use the full document
+                yield from parsed.get("resources", [])
+            if parse is not None:
+                parse(parsed)
+            if cache_key is not None:
+                self.cache.set(cache_key, content)
@@ -1,16 +1,64 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Dict, Optional, List, Union
 
 class GenerationRequest(BaseModel):
     prompt: str
-    environment: str = "dev"
+    environment: Optional[str] = "dev"  # None asks for an environment-neutral base (overlays add it)
     namespace: str = "default"
     replicas: int = 1
     expose: bool = False
     expose_type: str = "ClusterIP"
+    image: Optional[str] = None  # container image override, e.g. nginx:1.25
+    ports: List[int] = Field(default_factory=list)
+
+class EnvironmentProfile(BaseModel):
+    name: str
+    namespace: Optional[str] = None  # None keeps the base namespace
+    replicas: Optional[int] = None
+    labels: Dict[str, str] = Field(default_factory=dict)
+    resources: Optional[Dict[str, Dict[str, Union[str, int, float]]]] = None  # container {"requests": {...}, "limits": {...}}
+
+class ValidationIssue(BaseModel):
+    message: str
+    path: str = ""  # dotted field path inside the resource, e.g. spec.template.spec.containers[0].image
+    kind: Optional[str] = None
+    name: Optional[str] = None
+    file: Optional[str] = None
 
 class ValidationResult(BaseModel):
     valid: bool
     errors: List[str] = Field(default_factory=list)
+    issues: List[ValidationIssue] = Field(default_factory=list)
+    resource_count: int = 0
+    files_generated: List[str] = Field(default_factory=list)
+
+class PolicyViolation(BaseModel):
+    rule: str
+    severity: str  # error, warning or info
+    message: str
+    path: str = ""
+    kind: Optional[str] = None
+    name: Optional[str] = None
+    file: Optional[str] = None
+    fixed: bool = False
+    fixable: bool = False  # --fix would repair it (True for every fixed violation)
+
+class PolicyResult(BaseModel):
+    valid: bool  # no unfixed error-severity violations
+    violations: List[PolicyViolation] = Field(default_factory=list)
+    resource_count: int = 0
+    fixed_count: int = 0
+
+class BatchItem(GenerationRequest):
+    name: Optional[str] = None  # used as the item's output sub-directory
+
+class BatchItemResult(BaseModel):
+    name: str
+    success: bool
+    output_dir: str
+    backend: Optional[str] = None  # which generator backend answered
     resource_count: int = 0
     files_generated: List[str] = Field(default_factory=list)
+    validation: Optional[ValidationResult] = None
+    duration: float = 0.0
+    error: Optional[str] = None
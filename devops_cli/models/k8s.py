@@ -1,94 +1,263 @@
-from typing import Dict, List, Optional, Union, Any
-from pydantic import BaseModel, Field, field_validator
+from typing import Dict, List, Literal, Optional, Union, Any
+from typing_extensions import Annotated
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, TypeAdapter
 
-class K8sMetadata(BaseModel):
+class K8sModel(BaseModel):
+    # Kubernetes objects carry far more fields than we model explicitly;
+    # keep unknown ones instead of silently dropping them from the output.
+    model_config = ConfigDict(extra="allow")
+
+# Kubernetes quantities may be strings ("500m", "1Gi") or plain numbers (cpu: 1)
+Quantity = Union[str, int, float]
+
+# Optional fields default to None and dump_resource drops None, so a rendered
+# manifest holds exactly what was generated; Kubernetes applies its own defaults.
+
+class K8sMetadata(K8sModel):
     name: str = Field(..., description="Name of the resource")
-    namespace: str = Field("default", description="Namespace of the resource")
-    labels: Dict[str, str] = Field(default_factory=dict, description="Labels for the resource")
-    annotations: Optional[Dict[str, str]] = Field(default_factory=dict, description="Annotations for the resource")
+    namespace: Optional[str] = Field(None, description="Namespace of the resource")
+    labels: Optional[Dict[str, str]] = Field(None, description="Labels for the resource")
+    annotations: Optional[Dict[str, str]] = Field(None, description="Annotations for the resource")
 
-class ContainerResourceRequest(BaseModel):
-    cpu: str = Field("100m", description="CPU request")
-    memory: str = Field("128Mi", description="Memory request")
+class ContainerResourceRequest(K8sModel):
+    cpu: Optional[Quantity] = Field(None, description="CPU request")
+    memory: Optional[Quantity] = Field(None, description="Memory request")
 
-class ContainerResourceLimit(BaseModel):
-    cpu: str = Field("500m", description="CPU limit")
-    memory: str = Field("512Mi", description="Memory limit")
+class ContainerResourceLimit(K8sModel):
+    cpu: Optional[Quantity] = Field(None, description="CPU limit")
+    memory: Optional[Quantity] = Field(None, description="Memory limit")
 
-class ContainerResources(BaseModel):
-    requests: ContainerResourceRequest = Field(default_factory=ContainerResourceRequest)
-    limits: ContainerResourceLimit = Field(default_factory=ContainerResourceLimit)
+class ContainerResources(K8sModel):
+    requests: Optional[ContainerResourceRequest] = None
+    limits: Optional[ContainerResourceLimit] = None
 
-class ContainerPort(BaseModel):
+def default_resources() -> ContainerResources:
+    """The requests/limits used when generated containers need explicit values."""
+    return ContainerResources(
+        requests=ContainerResourceRequest(cpu="100m", memory="128Mi"),
+        limits=ContainerResourceLimit(cpu="500m", memory="512Mi"),
+    )
+
+class ContainerPort(K8sModel):
     containerPort: int = Field(..., description="Port exposed by the container")
-    protocol: str = Field("TCP", description="Protocol (TCP/UDP)")
+    protocol: Optional[str] = Field(None, description="Protocol (TCP/UDP)")
 
-class ContainerProbe(BaseModel):
+class ContainerProbe(K8sModel):
     httpGet: Optional[Dict[str, Any]] = None
     tcpSocket: Optional[Dict[str, Any]] = None
     exec: Optional[Dict[str, Any]] = None # 'exec' is a keyword in python, but valid in k8s yaml, handled by alias or dict export
-    initialDelaySeconds: int = 10
-    periodSeconds: int = 10
+    initialDelaySeconds: Optional[int] = None
+    periodSeconds: Optional[int] = None
 
-class Container(BaseModel):
+class Container(K8sModel):
     name: str
     image: str
-    imagePullPolicy: str = "IfNotPresent"
-    ports: List[ContainerPort] = Field(default_factory=list)
-    resources: ContainerResources = Field(default_factory=ContainerResources)
-    env: List[Dict[str, str]] = Field(default_factory=list)
+    imagePullPolicy: Optional[str] = None
+    ports: Optional[List[ContainerPort]] = None
+    resources: Optional[ContainerResources] = None
+    env: Optional[List[Dict[str, Any]]] = None
     readinessProbe: Optional[ContainerProbe] = None
     livenessProbe: Optional[ContainerProbe] = None
-    securityContext: Dict[str, Any] = Field(default={"allowPrivilegeEscalation": False}, description="Container security context")
+    securityContext: Optional[Dict[str, Any]] = Field(None, description="Container security context")
 
-class PodSpec(BaseModel):
+class PodSpec(K8sModel):
     containers: List[Container]
-    restartPolicy: str = "Always"
+    restartPolicy: Optional[str] = None
     serviceAccountName: Optional[str] = None
-    securityContext: Dict[str, Any] = Field(default={}, description="Pod security context")
-
-class DeploymentSpec(BaseModel):
-    replicas: int = Field(1, ge=1)
-    selector: Dict[str, Dict[str, str]] = Field(description="Label selector")
-    template: Dict[str, Any] = Field(description="Pod template")
-
-    @field_validator('template')
-    @classmethod
-    def validate_template(cls, v):
-        # In a real scenario we'd unpack this further, but for simplicity keeping it flexible
-        # or mapping to a PodTemplateSpec model
-        return v
-
-# More strict Deployment model
-class K8sDeployment(BaseModel):
+    securityContext: Optional[Dict[str, Any]] = Field(None, description="Pod security context")
+
+class PodTemplateMetadata(K8sModel):
+    labels: Optional[Dict[str, str]] = None
+    annotations: Optional[Dict[str, str]] = None
+
+class PodTemplateSpec(K8sModel):
+    metadata: PodTemplateMetadata = Field(default_factory=PodTemplateMetadata)
+    spec: PodSpec
+
+class LabelSelector(K8sModel):
+    matchLabels: Optional[Dict[str, str]] = None
+    matchExpressions: Optional[List[Dict[str, Any]]] = None
+
+class DeploymentSpec(K8sModel):
+    replicas: Optional[int] = Field(None, ge=0)  # 0 is a valid, scaled-down deployment
+    selector: LabelSelector = Field(description="Label selector")
+    template: PodTemplateSpec = Field(description="Pod template")
+
+class K8sDeployment(K8sModel):
+    apiVersion: str = "apps/v1"
+    kind: Literal["Deployment"] = "Deployment"
+    metadata: K8sMetadata
+    spec: DeploymentSpec
+
+class StatefulSetSpec(K8sModel):
+    serviceName: Optional[str] = None
+    replicas: Optional[int] = Field(None, ge=0)
+    selector: LabelSelector
+    template: PodTemplateSpec
+    volumeClaimTemplates: Optional[List[Dict[str, Any]]] = None
+
+class K8sStatefulSet(K8sModel):
+    apiVersion: str = "apps/v1"
+    kind: Literal["StatefulSet"] = "StatefulSet"
+    metadata: K8sMetadata
+    spec: StatefulSetSpec
+
+class DaemonSetSpec(K8sModel):
+    selector: LabelSelector
+    template: PodTemplateSpec
+
+class K8sDaemonSet(K8sModel):
     apiVersion: str = "apps/v1"
-    kind: str = "Deployment"
+    kind: Literal["DaemonSet"] = "DaemonSet"
+    metadata: K8sMetadata
+    spec: DaemonSetSpec
+
+class JobSpec(K8sModel):
+    template: PodTemplateSpec
+    backoffLimit: Optional[int] = None
+
+class K8sJob(K8sModel):
+    apiVersion: str = "batch/v1"
+    kind: Literal["Job"] = "Job"
+    metadata: K8sMetadata
+    spec: JobSpec
+
+class JobTemplateSpec(K8sModel):
+    metadata: Optional[PodTemplateMetadata] = None
+    spec: JobSpec
+
+class CronJobSpec(K8sModel):
+    schedule: str
+    jobTemplate: JobTemplateSpec
+
+class K8sCronJob(K8sModel):
+    apiVersion: str = "batch/v1"
+    kind: Literal["CronJob"] = "CronJob"
     metadata: K8sMetadata
-    spec: Any  # keeping it loosely typed to match K8s flexibility or strictly typed if we define DeploymentSpec fully
+    spec: CronJobSpec
 
-class ServicePort(BaseModel):
+class ServicePort(K8sModel):
     port: int
     targetPort: Union[int, str]
-    protocol: str = "TCP"
+    protocol: Optional[str] = None
     name: Optional[str] = None
 
-class ServiceSpec(BaseModel):
+class ServiceSpec(K8sModel):
     selector: Dict[str, str]
     ports: List[ServicePort]
-    type: str = "ClusterIP"
+    type: Optional[str] = None  # Kubernetes defaults to ClusterIP
 
-class K8sService(BaseModel):
+class K8sService(K8sModel):
     apiVersion: str = "v1"
-    kind: str = "Service"
+    kind: Literal["Service"] = "Service"
     metadata: K8sMetadata
     spec: ServiceSpec
 
-class K8sConfigMap(BaseModel):
+class K8sConfigMap(K8sModel):
     apiVersion: str = "v1"
-    kind: str = "ConfigMap"
+    kind: Literal["ConfigMap"] = "ConfigMap"
     metadata: K8sMetadata
-    data: Dict[str, str] = Field(default_factory=dict)
+    data: Optional[Dict[str, str]] = None
+
+class K8sSecret(K8sModel):
+    apiVersion: str = "v1"
+    kind: Literal["Secret"] = "Secret"
+    metadata: K8sMetadata
+    type: Optional[str] = None
+    data: Optional[Dict[str, str]] = None
+    stringData: Optional[Dict[str, str]] = None
+
+class IngressSpec(K8sModel):
+    ingressClassName: Optional[str] = None
+    rules: Optional[List[Dict[str, Any]]] = None
+    tls: Optional[List[Dict[str, Any]]] = None
+
+class K8sIngress(K8sModel):
+    apiVersion: str = "networking.k8s.io/v1"
+    kind: Literal["Ingress"] = "Ingress"
+    metadata: K8sMetadata
+    spec: IngressSpec
+
+class ScaleTargetRef(K8sModel):
+    apiVersion: str = "apps/v1"
+    kind: str
+    name: str
+
+class HorizontalPodAutoscalerSpec(K8sModel):
+    scaleTargetRef: ScaleTargetRef
+    minReplicas: Optional[int] = Field(None, ge=1)
+    maxReplicas: int = Field(..., ge=1)
+    metrics: Optional[List[Dict[str, Any]]] = None
+
+class K8sHorizontalPodAutoscaler(K8sModel):
+    apiVersion: str = "autoscaling/v2"
+    kind: Literal["HorizontalPodAutoscaler"] = "HorizontalPodAutoscaler"
+    metadata: K8sMetadata
+    spec: HorizontalPodAutoscalerSpec
+
+class PersistentVolumeClaimSpec(K8sModel):
+    accessModes: Optional[List[str]] = None
+    resources: Dict[str, Any]
+    storageClassName: Optional[str] = None
+
+class K8sPersistentVolumeClaim(K8sModel):
+    apiVersion: str = "v1"
+    kind: Literal["PersistentVolumeClaim"] = "PersistentVolumeClaim"
+    metadata: K8sMetadata
+    spec: PersistentVolumeClaimSpec
+
+class GenericMetadata(K8sModel):
+    # Unlike K8sMetadata, no namespace is invented: the kind may be cluster-scoped
+    name: str
+    namespace: Optional[str] = None
+    labels: Optional[Dict[str, str]] = None
+    annotations: Optional[Dict[str, str]] = None
+
+class K8sGenericResource(K8sModel):
+    """
+    Typed fallback for kinds without a dedicated model; every field beyond
+    apiVersion/kind/metadata is kept as-is.
+    """
+    apiVersion: str
+    kind: str
+    metadata: GenericMetadata
+
+TYPED_RESOURCES = (
+    K8sDeployment,
+    K8sStatefulSet,
+    K8sDaemonSet,
+    K8sJob,
+    K8sCronJob,
+    K8sService,
+    K8sConfigMap,
+    K8sSecret,
+    K8sIngress,
+    K8sHorizontalPodAutoscaler,
+    K8sPersistentVolumeClaim,
+)
+TYPED_KINDS = frozenset(model.model_fields["kind"].default for model in TYPED_RESOURCES)
+GENERIC_TAG = "Generic"
+
+def resource_kind(value: Any) -> str:
+    # Picks exactly one union member per resource instead of trying each in turn
+    kind = value.get("kind") if isinstance(value, dict) else getattr(value, "kind", None)
+    return kind if kind in TYPED_KINDS else GENERIC_TAG
 
 # Union type for list of resources
+K8sResource = Annotated[
+    Union[
+        tuple(Annotated[model, Tag(model.model_fields["kind"].default)] for model in TYPED_RESOURCES)
+        + (Annotated[K8sGenericResource, Tag(GENERIC_TAG)],)
+    ],
+    Discriminator(resource_kind),
+]
+
+# Built once at import; validating/dumping through them avoids rebuilding schemas per call
+K8sResourceAdapter = TypeAdapter(K8sResource)
+K8sResourcesAdapter = TypeAdapter(List[K8sResource])
+
+def dump_resource(resource: K8sResource) -> Dict[str, Any]:
+    return K8sResourceAdapter.dump_python(resource, exclude_none=True, by_alias=True)
+
 class K8sResourceList(BaseModel):
-    resources: List[Union[K8sDeployment, K8sService, K8sConfigMap, Dict[str, Any]]]
+    resources: List[K8sResource]
@@ -0,0 +1,135 @@
+import json
+from typing import Dict, List, Optional
+from ruamel.yaml import YAML
+from devops_cli.models.internal import EnvironmentProfile
+from devops_cli.models.k8s import K8sResourceList, dump_resource
+
+KUSTOMIZE_API_VERSION = "kustomize.config.k8s.io/v1beta1"
+KUSTOMIZATION_FILENAME = "kustomization.yaml"
+
+# JSON pointer to the pod template of each workload kind
+POD_TEMPLATE_PATHS = {
+    "Deployment": "/spec/template",
+    "StatefulSet": "/spec/template",
+    "DaemonSet": "/spec/template",
+    "Job": "/spec/template",
+    "CronJob": "/spec/jobTemplate/spec/template",
+}
+# Kinds kustomize's replicas field applies to
+SCALABLE_KINDS = ("Deployment", "StatefulSet")
+
+
+def load_profiles(path: str) -> Dict[str, EnvironmentProfile]:
+    """
+    Loads per-environment profiles from a YAML or JSON file, either a mapping
+    of environment name to profile or the same mapping under 'environments'.
+    """
+    with open(path) as f:
+        data = YAML(typ="safe").load(f) or {}
+    if "environments" in data:
+        data = data["environments"] or {}
+    return {name: EnvironmentProfile.model_validate({"name": name, **(entry or {})}) for name, entry in data.items()}
+
+
+def resolve_profiles(environments: List[str], profiles: Optional[Dict[str, EnvironmentProfile]] = None) -> List[EnvironmentProfile]:
+    profiles = profiles or {}
+    return [profiles.get(env) or EnvironmentProfile(name=env) for env in environments]
+
+
+def profile_labels(profile: EnvironmentProfile) -> Dict[str, str]:
+    return {"environment": profile.name, **profile.labels}
+
+
+def _containers(data: dict, pointer: str) -> List[dict]:
+    node = data
+    for key in pointer.strip("/").split("/"):
+        node = node.get(key) or {}
+    return node.get("spec", {}).get("containers", [])
+
+
+def base_kustomization(files: List[str]) -> dict:
+    return {
+        "apiVersion": KUSTOMIZE_API_VERSION,
+        "kind": "Kustomization",
+        "resources": sorted(f.rsplit("/", 1)[-1] for f in files),
+    }
+
+
+def overlay_kustomization(resource_list: K8sResourceList, profile: EnvironmentProfile) -> dict:
+    """
+    Kustomization for one environment on top of ../../base: namespace,
+    labels (pod templates included, selectors untouched), replica counts
+    and JSON6902 patches setting container resources.
+    """
+    kustomization = {
+        "apiVersion": KUSTOMIZE_API_VERSION,
+        "kind": "Kustomization",
+        "resources": ["../../base"],
+    }
+    if profile.namespace:
+        kustomization["namespace"] = profile.namespace
+    kustomization["labels"] = [
+        {"pairs": profile_labels(profile), "includeSelectors": False, "includeTemplates": True}
+    ]
+
+    if profile.replicas is not None:
+        replicas = [
+            {"name": r.metadata.name, "count": profile.replicas}
+            for r in resource_list.resources if r.kind in SCALABLE_KINDS
+        ]
+        if replicas:
+            kustomization["replicas"] = replicas
+
+    if profile.resources:
+        patches = []
+        for resource in resource_list.resources:
+            pointer = POD_TEMPLATE_PATHS.get(resource.kind)
+            if pointer is None:
+                continue
+            containers = _containers(dump_resource(resource), pointer)
+            ops = [
+                {"op": "add", "path": f"{pointer}/spec/containers/{i}/resources", "value": profile.resources}
+                for i in range(len(containers))
+            ]
+            if ops:
+                patches.append({
+                    "target": {"kind": resource.kind, "name": resource.metadata.name},
+                    "patch": json.dumps(ops),
+                })
+        if patches:
+            kustomization["patches"] = patches
+
+    return kustomization
+
+
+def _apply(data: dict, kind: str, profile: EnvironmentProfile) -> dict:
+    labels = profile_labels(profile)
+    metadata = data.setdefault("metadata", {})
+    metadata["labels"] = {**(metadata.get("labels") or {}), **labels}
+    if profile.namespace:
+        metadata["namespace"] = profile.namespace
+
+    pointer = POD_TEMPLATE_PATHS.get(kind)
+    if pointer is None:
+        return data
+    if profile.replicas is not None and kind in SCALABLE_KINDS:
+        data["spec"]["replicas"] = profile.replicas
+
+    template = data
+    for key in pointer.strip("/").split("/"):
+        template = template.setdefault(key, {})
+    template_metadata = template.setdefault("metadata", {})
+    template_metadata["labels"] = {**(template_metadata.get("labels") or {}), **labels}
+    if profile.resources:
+        for container in template.get("spec", {}).get("containers", []):
+            container["resources"] = profile.resources
+    return data
+
+
+def apply_profile(resource_list: K8sResourceList, profile: EnvironmentProfile) -> K8sResourceList:
+    """
+    The resources an overlay builds, computed in memory (same changes as
+    overlay_kustomization), e.g. to validate each environment without kustomize.
+    """
+    resources = [_apply(dump_resource(r), r.kind, profile) for r in resource_list.resources]
+    return K8sResourceList.model_validate({"resources": resources})
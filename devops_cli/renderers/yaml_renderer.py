@@ -1,34 +1,190 @@
 import os
+import io
+import json
+from typing import List, TextIO
 from ruamel.yaml import YAML
-from devops_cli.models.k8s import K8sResourceList
+from devops_cli.fsutil import atomic_write
+from devops_cli.models.internal import EnvironmentProfile
+from devops_cli.models.k8s import K8sResource, K8sResourceList, dump_resource
+from devops_cli.renderers.kustomize import KUSTOMIZATION_FILENAME, base_kustomization, overlay_kustomization
+from devops_cli.telemetry import span
+
+# Lists the files written by the previous render so stale ones can be pruned
+INDEX_FILENAME = ".devops-cli-index.json"
 
 class YamlRenderer:
     def __init__(self):
         self.yaml = YAML()
         self.yaml.preserve_quotes = True
         self.yaml.indent(mapping=2, sequence=4, offset=2)
+        self.stats = {"written": 0, "unchanged": 0, "pruned": 0, "bytes_written": 0}
+
+    @staticmethod
+    def filename(resource: K8sResource) -> str:
+        # Determine filename
+        kind = resource.kind.lower()
+        name = resource.metadata.name
+        return f"{name}-{kind}.yaml"
+
+    def dumps(self, resource: K8sResource) -> str:
+        # Dump model to dict
+        # We use exclude_none=True to keep it clean, but careful with required fields
+        resource_dict = dump_resource(resource)
+
+        buf = io.StringIO()
+        self.yaml.dump(resource_dict, buf)
+        return buf.getvalue()
+
+    def render_resource(self, resource: K8sResource, output_dir: str, incremental: bool = False) -> str:
+        os.makedirs(output_dir, exist_ok=True)
+        filepath = os.path.join(output_dir, self.filename(resource))
+
+        if not incremental:
+            with open(filepath, 'w') as f:
+                self.yaml.dump(dump_resource(resource), f)
+                self.stats["bytes_written"] += f.tell()
+            self.stats["written"] += 1
+            return filepath
+
+        return self._write_content(filepath, self.dumps(resource))
+
+    def _write_content(self, filepath: str, content: str) -> str:
+        # Only touch the file when its content changes, so mtimes stay meaningful
+        try:
+            with open(filepath) as f:
+                unchanged = f.read() == content
+        except FileNotFoundError:
+            unchanged = False
+
+        if unchanged:
+            self.stats["unchanged"] += 1
+        else:
+            atomic_write(filepath, content)
+            self.stats["written"] += 1
+            self.stats["bytes_written"] += len(content.encode("utf-8"))
+        return filepath
+
+    def _read_index(self, output_dir: str) -> List[str]:
+        try:
+            with open(os.path.join(output_dir, INDEX_FILENAME)) as f:
+                return json.load(f).get("files", [])
+        except (FileNotFoundError, ValueError):
+            return []
 
-    def render(self, resource_list: K8sResourceList, output_dir: str) -> list[str]:
+    def update_index(self, output_dir: str, files: List[str], prune: bool = False) -> List[str]:
+        """
+        Records the files of this render and, with prune, deletes files that
+        an earlier render produced but this one did not. Returns pruned paths.
+        """
+        current = sorted(os.path.relpath(f, output_dir) for f in files)
+        pruned = []
+        if prune:
+            for name in self._read_index(output_dir):
+                if os.path.isabs(name) or name.startswith(".."):
+                    continue  # never prune outside output_dir
+                if name not in current:
+                    path = os.path.join(output_dir, name)
+                    try:
+                        os.unlink(path)
+                        pruned.append(path)
+                    except FileNotFoundError:
+                        pass
+                    if os.path.dirname(name):
+                        try:
+                            os.rmdir(os.path.dirname(path))  # only succeeds once the directory is empty
+                        except OSError:
+                            pass
+            self.stats["pruned"] += len(pruned)
+
+        atomic_write(os.path.join(output_dir, INDEX_FILENAME), json.dumps({"files": current}, indent=2))
+        return pruned
+
+    def render(self, resource_list: K8sResourceList, output_dir: str, incremental: bool = False, prune: bool = False) -> list[str]:
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
 
+        self.stats = {"written": 0, "unchanged": 0, "pruned": 0, "bytes_written": 0}
         generated_files = []
 
-        for resource in resource_list.resources:
-            # Determine filename
-            kind = resource.kind.lower()
-            name = resource.metadata.name
-            filename = f"{name}-{kind}.yaml"
-            filepath = os.path.join(output_dir, filename)
+        with span("renderer.render", resource_count=len(resource_list.resources), incremental=incremental) as trace_span:
+            for resource in resource_list.resources:
+                generated_files.append(self.render_resource(resource, output_dir, incremental=incremental))
 
-            # Dump model to dict
-            # We use exclude_none=True to keep it clean, but careful with required fields
-            # Pydantic's model_dump is good.
-            resource_dict = resource.model_dump(exclude_none=True, by_alias=True)
+            if incremental or prune:
+                self.update_index(output_dir, generated_files, prune=prune)
 
-            with open(filepath, 'w') as f:
-                self.yaml.dump(resource_dict, f)
-            
-            generated_files.append(filepath)
+            for key, value in self.stats.items():
+                trace_span.set(key, value)
 
         return generated_files
+
+    def document(self, resource: K8sResource) -> str:
+        return "---\n" + self.dumps(resource)
+
+    def render_stream(self, resource_list: K8sResourceList, stream: TextIO) -> None:
+        """
+        Writes all resources as one multi-document YAML stream, e.g. for
+        piping into `kubectl apply -f -`.
+        """
+        with span("renderer.render_stream", resource_count=len(resource_list.resources)) as trace_span:
+            content = "".join(self.document(resource) for resource in resource_list.resources)
+            stream.write(content)
+            trace_span.set("bytes_written", len(content.encode("utf-8")))
+
+    def render_bundle(self, resource_list: K8sResourceList, path: str, incremental: bool = False) -> str:
+        """
+        Writes all resources into a single multi-document file, atomically.
+        """
+        self.stats = {"written": 0, "unchanged": 0, "pruned": 0, "bytes_written": 0}
+        with span("renderer.render_bundle", resource_count=len(resource_list.resources)) as trace_span:
+            content = "".join(self.document(resource) for resource in resource_list.resources)
+            if incremental:
+                try:
+                    with open(path) as f:
+                        if f.read() == content:
+                            self.stats["unchanged"] += 1
+                            return path
+                except FileNotFoundError:
+                    pass
+            atomic_write(path, content)
+            self.stats["written"] += 1
+            self.stats["bytes_written"] += len(content.encode("utf-8"))
+            trace_span.set("bytes_written", self.stats["bytes_written"])
+        return path
+
+    def _write_dict(self, data: dict, filepath: str) -> str:
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        buf = io.StringIO()
+        self.yaml.dump(data, buf)
+        return self._write_content(filepath, buf.getvalue())
+
+    def render_overlays(
+        self,
+        resource_list: K8sResourceList,
+        output_dir: str,
+        profiles: List[EnvironmentProfile],
+        incremental: bool = False,
+        prune: bool = False,
+    ) -> List[str]:
+        """
+        Writes a kustomize layout: the resources once under base/, plus one
+        overlays/<env>/kustomization.yaml per environment profile. With prune,
+        overlays of environments no longer rendered are removed as well.
+        """
+        base_dir = os.path.join(output_dir, "base")
+        files = self.render(resource_list, base_dir, incremental=incremental, prune=prune)
+
+        with span("renderer.render_overlays", environments=len(profiles)) as trace_span:
+            files.append(self._write_dict(base_kustomization(files), os.path.join(base_dir, KUSTOMIZATION_FILENAME)))
+            overlays_dir = os.path.join(output_dir, "overlays")
+            overlay_files = []
+            for profile in profiles:
+                path = os.path.join(overlays_dir, profile.name, KUSTOMIZATION_FILENAME)
+                overlay_files.append(self._write_dict(overlay_kustomization(resource_list, profile), path))
+            if incremental or prune:
+                self.update_index(overlays_dir, overlay_files, prune=prune)
+            files += overlay_files
+            for key, value in self.stats.items():
+                trace_span.set(key, value)
+
+        return files
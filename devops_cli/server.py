@@ -0,0 +1,515 @@
+"""
+Long-running HTTP API around the generate -> render -> validate pipeline.
+
+One process keeps the LLM client (and its keep-alive connection pool), the
+renderer, validators and compiled schemas warm across requests, instead of
+paying interpreter start-up and client construction per CLI call.
+
+    POST /v1/generate   GenerationRequest JSON            -> resources (JSON or YAML)
+    POST /v1/render     {"resources": [...]}              -> multi-document YAML (or JSON)
+    POST /v1/validate   {"resources": [...]} or YAML      -> validation and policy results
+    GET  /metrics       request counts, latency percentiles, throughput
+    GET  /healthz
+
+Responses default to JSON for generate/validate and YAML for render; pass
+?format=json|yaml or an Accept header naming yaml to choose. YAML responses
+carry the policy (and ?validate) results as leading comments and X-Policy-* /
+X-Validation-* headers. Built on asyncio streams only, so serving needs no
+extra dependency; CPU-bound work (model validation of LLM responses, policy,
+schema validation, YAML and JSON encoding) runs in worker threads so the
+event loop keeps answering /healthz and /metrics.
+"""
+import io
+import json
+import os
+import time
+import asyncio
+import tempfile
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from pydantic import ValidationError
+from ruamel.yaml import YAML
+from devops_cli.config import DEFAULT_CONCURRENCY
+from devops_cli.generators.backends import GeneratorBackend
+from devops_cli.generators.k8s_generator import K8sGenerator
+from devops_cli.llm_client import LLMClient
+from devops_cli.models.internal import GenerationRequest, PolicyResult, ValidationResult
+from devops_cli.models.k8s import K8sResourceList, dump_resource
+from devops_cli.renderers.yaml_renderer import YamlRenderer
+from devops_cli.validators.k8s_validator import K8sValidator
+from devops_cli.validators.native_validator import NativeValidator
+from devops_cli.validators.policy import PolicyEngine, default_rules
+
+MAX_BODY_BYTES = 10 * 1024 * 1024
+MAX_HEADERS = 100
+KEEP_ALIVE_TIMEOUT = 30.0  # idle time allowed before the next request line
+REQUEST_TIMEOUT = 30.0  # time allowed for the headers and body once a request has started
+LATENCY_WINDOW = 10000  # most recent requests kept per endpoint for percentiles
+
+REASONS = {
+    100: "Continue", 200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    411: "Length Required", 413: "Payload Too Large", 422: "Unprocessable Entity",
+    500: "Internal Server Error", 502: "Bad Gateway", 503: "Service Unavailable",
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class Request:
+    def __init__(self, method: str, target: str, headers: Dict[str, str], body: bytes):
+        url = urlsplit(target)
+        self.method = method
+        self.path = url.path
+        self.query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        try:
+            return json.loads(self.body or b"{}")
+        except ValueError as e:
+            raise HTTPError(400, f"Invalid JSON body: {e}")
+
+    def flag(self, name: str, default: bool = False) -> bool:
+        value = self.query.get(name)
+        if value is None:
+            return default
+        return value.lower() in ("1", "true", "yes", "on")
+
+    def wants_yaml(self, default: bool) -> bool:
+        fmt = self.query.get("format")
+        if fmt:
+            if fmt not in ("json", "yaml"):
+                raise HTTPError(400, f"Unknown format '{fmt}' (expected json or yaml)")
+            return fmt == "yaml"
+        accept = self.headers.get("accept", "")
+        if "yaml" in accept:
+            return True
+        if "json" in accept:
+            return False
+        return default
+
+
+class Response:
+    def __init__(
+        self,
+        status: int = 200,
+        body: bytes = b"",
+        content_type: str = "application/json",
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        self.status = status
+        self.body = body
+        self.content_type = content_type
+        self.headers = headers or {}
+
+    @classmethod
+    def json(cls, data, status: int = 200) -> "Response":
+        return cls(status, json.dumps(data, default=str).encode("utf-8"))
+
+    @classmethod
+    def yaml(cls, text: str, headers: Optional[Dict[str, str]] = None) -> "Response":
+        return cls(200, text.encode("utf-8"), "application/yaml", headers)
+
+
+def yaml_report(
+    policy_result: Optional[PolicyResult], validation: Optional[ValidationResult]
+) -> Tuple[str, Dict[str, str]]:
+    """
+    Policy and validation results for a YAML response, as leading YAML
+    comments (ignored by kubectl) and as response headers.
+    """
+    lines: List[str] = []
+    headers: Dict[str, str] = {}
+    if policy_result is not None:
+        headers["X-Policy-Valid"] = str(policy_result.valid).lower()
+        headers["X-Policy-Violations"] = str(len(policy_result.violations))
+        headers["X-Policy-Fixed"] = str(policy_result.fixed_count)
+        lines.append(
+            f"# policy: {'passed' if policy_result.valid else 'failed'}, "
+            f"{len(policy_result.violations)} violation(s), {policy_result.fixed_count} fixed"
+        )
+        for v in policy_result.violations:
+            state = " (fixed)" if v.fixed else ""
+            lines.append(f"#   {v.severity} {v.kind}/{v.name} {v.path}: {v.message} ({v.rule}){state}")
+    if validation is not None:
+        headers["X-Validation-Valid"] = str(validation.valid).lower()
+        lines.append(f"# validation: {'passed' if validation.valid else 'failed'}")
+        for err in validation.errors:
+            lines.append("#   " + " ".join(err.split()))
+    return "".join(line + "\n" for line in lines), headers
+
+
+class ServerMetrics:
+    """
+    Request counts, error counts and a rolling window of latencies per endpoint.
+    """
+
+    def __init__(self):
+        self.started = time.time()
+        self.in_flight = 0
+        self.rejected = 0
+        self.endpoints: Dict[str, dict] = {}
+        self.backends: Dict[str, int] = {}
+
+    def record(self, endpoint: str, status: int, seconds: float) -> None:
+        entry = self.endpoints.setdefault(
+            endpoint, {"count": 0, "errors": 0, "latencies": deque(maxlen=LATENCY_WINDOW)}
+        )
+        entry["count"] += 1
+        if status >= 500:
+            entry["errors"] += 1
+        entry["latencies"].append(seconds)
+
+    @staticmethod
+    def percentile(values: List[float], pct: float) -> float:
+        if not values:
+            return 0.0
+        index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+        return values[index]
+
+    def snapshot(self) -> dict:
+        uptime = time.time() - self.started
+        endpoints = {}
+        for name, entry in sorted(self.endpoints.items()):
+            latencies = sorted(entry["latencies"])
+            endpoints[name] = {
+                "count": entry["count"],
+                "errors": entry["errors"],
+                "latency_ms": {
+                    "mean": sum(latencies) / len(latencies) * 1000 if latencies else 0.0,
+                    "p50": self.percentile(latencies, 50) * 1000,
+                    "p95": self.percentile(latencies, 95) * 1000,
+                    "p99": self.percentile(latencies, 99) * 1000,
+                    "max": latencies[-1] * 1000 if latencies else 0.0,
+                },
+            }
+        total = sum(entry["count"] for entry in self.endpoints.values())
+        return {
+            "uptime_seconds": uptime,
+            "in_flight": self.in_flight,
+            "rejected": self.rejected,
+            "requests_total": total,
+            "errors_total": sum(entry["errors"] for entry in self.endpoints.values()),
+            "throughput_rps": total / uptime if uptime else 0.0,
+            "backends": dict(self.backends),
+            "endpoints": endpoints,
+        }
+
+
+class DevopsServer:
+    """
+    Serves the HTTP API on one event loop. At most `concurrency` requests are
+    processed at a time; up to `max_pending` more wait, anything beyond that
+    is answered with 503 straight away.
+    """
+
+    def __init__(
+        self,
+        llm_client: Optional[LLMClient] = None,
+        backends: Optional[List[GeneratorBackend]] = None,
+        renderer: Optional[YamlRenderer] = None,
+        validator: Optional[K8sValidator] = None,
+        native_validator: Optional[NativeValidator] = None,
+        policy_severities: Optional[Dict[str, str]] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_pending: Optional[int] = None,
+    ):
+        self.llm_client = llm_client or LLMClient()
+        self.backends = backends or []
+        self.renderer = renderer or YamlRenderer()
+        self.validator = validator
+        self.native_validator = native_validator
+        self.policy_severities = policy_severities or {}
+        self.concurrency = max(1, concurrency)
+        self.max_pending = self.concurrency * 4 if max_pending is None else max_pending
+        self.metrics = ServerMetrics()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._waiting = 0
+        # ruamel YAML instances are not thread-safe: each worker thread gets its own
+        self._local = threading.local()
+        self.routes = {
+            ("POST", "/v1/generate"): self.handle_generate,
+            ("POST", "/v1/render"): self.handle_render,
+            ("POST", "/v1/validate"): self.handle_validate,
+            ("GET", "/metrics"): self.handle_metrics,
+            ("GET", "/healthz"): self.handle_health,
+        }
+        self.paths = {path for _, path in self.routes}
+
+    # Handlers
+
+    async def handle_generate(self, request: Request) -> Response:
+        as_yaml = request.wants_yaml(default=False)
+        data = request.json()
+        try:
+            gen_request = GenerationRequest.model_validate(data)
+        except ValidationError as e:
+            raise HTTPError(422, str(e))
+
+        # A generator per request keeps last_backend request-local; the client,
+        # its connection pool and the backends are shared and stay warm
+        generator = K8sGenerator(self.llm_client, backends=self.backends)
+        try:
+            resources = await generator.agenerate(gen_request)
+        except Exception as e:
+            raise HTTPError(502, f"Generation failed: {e}")
+        self.metrics.backends[generator.last_backend] = self.metrics.backends.get(generator.last_backend, 0) + 1
+
+        policy = PolicyEngine(
+            # An environment-neutral request (environment: null) is a base: only 'app' is required
+            rules=None if gen_request.environment else default_rules(labels=("app",)),
+            severities=self.policy_severities,
+            environment=gen_request.environment,
+        )
+        policy_result = await asyncio.to_thread(policy.check, resources, request.flag("fix"))
+        validation = None
+        if request.flag("validate"):
+            validation = await self.validate(resources, request.query.get("validator"))
+
+        if as_yaml:
+            report, headers = yaml_report(policy_result, validation)
+            headers["X-Backend"] = generator.last_backend
+            return Response.yaml(report + await asyncio.to_thread(self.render_yaml, resources), headers)
+
+        def json_response() -> Response:
+            body = {
+                "backend": generator.last_backend,
+                "resources": [dump_resource(r) for r in resources.resources],
+                "policy": policy_result.model_dump(),
+            }
+            if validation is not None:
+                body["validation"] = validation.model_dump()
+            return Response.json(body)
+
+        return await asyncio.to_thread(json_response)
+
+    async def handle_render(self, request: Request) -> Response:
+        as_yaml = request.wants_yaml(default=True)
+        resources = await self.parse_resources(request)
+        if as_yaml:
+            return Response.yaml(await asyncio.to_thread(self.render_yaml, resources))
+        return Response.json({"manifests": await asyncio.to_thread(self.render_manifests, resources)})
+
+    async def handle_validate(self, request: Request) -> Response:
+        resources = await self.parse_resources(request)
+        validation = await self.validate(resources, request.query.get("validator"))
+        policy_result = await asyncio.to_thread(PolicyEngine(severities=self.policy_severities).check, resources)
+        return Response.json({"validation": validation.model_dump(), "policy": policy_result.model_dump()})
+
+    async def handle_metrics(self, request: Request) -> Response:
+        snapshot = self.metrics.snapshot()
+        snapshot["concurrency"] = self.concurrency
+        snapshot["pending"] = self._waiting
+        if self.llm_client.cache is not None:
+            snapshot["llm_cache"] = dict(self.llm_client.cache.stats)
+        return Response.json(snapshot)
+
+    async def handle_health(self, request: Request) -> Response:
+        return Response.json({"status": "ok"})
+
+    # Helpers
+
+    def thread_renderer(self) -> YamlRenderer:
+        renderer = getattr(self._local, "renderer", None)
+        if renderer is None:
+            renderer = self._local.renderer = type(self.renderer)()
+        return renderer
+
+    def load_yaml(self, text: str) -> list:
+        yaml = getattr(self._local, "yaml", None)
+        if yaml is None:
+            yaml = self._local.yaml = YAML(typ="safe")
+        return [doc for doc in yaml.load_all(text) if doc]
+
+    async def parse_resources(self, request: Request) -> K8sResourceList:
+        content_type = request.headers.get("content-type", "")
+        text = request.body.decode("utf-8", errors="replace").lstrip()
+        if "yaml" in content_type or not text.startswith(("{", "[")):
+            try:
+                data = await asyncio.to_thread(self.load_yaml, text)
+            except Exception as e:
+                raise HTTPError(400, f"Invalid YAML body: {e}")
+        else:
+            data = request.json()
+        if isinstance(data, list):
+            data = {"resources": data}
+        try:
+            return await asyncio.to_thread(K8sResourceList.model_validate, data)
+        except ValidationError as e:
+            raise HTTPError(422, str(e))
+
+    def render_yaml(self, resources: K8sResourceList) -> str:
+        buf = io.StringIO()
+        self.thread_renderer().render_stream(resources, buf)
+        return buf.getvalue()
+
+    def render_manifests(self, resources: K8sResourceList) -> Dict[str, str]:
+        renderer = self.thread_renderer()
+        return {renderer.filename(r): renderer.dumps(r) for r in resources.resources}
+
+    def kubeconform(self, validator: K8sValidator, resources: K8sResourceList) -> ValidationResult:
+        with tempfile.TemporaryDirectory(prefix="devops-cli-serve-") as tmp:
+            self.thread_renderer().render(resources, tmp)
+            result = validator.validate(tmp)
+        for issue in result.issues:
+            if issue.file:
+                issue.file = os.path.basename(issue.file)
+        result.files_generated = [os.path.basename(f) for f in result.files_generated]
+        return result
+
+    async def validate(self, resources: K8sResourceList, backend: Optional[str] = None) -> ValidationResult:
+        backend = backend or ("kubeconform" if self.validator is not None else "native")
+        if backend == "native":
+            validator = self.native_validator or NativeValidator()
+            return await asyncio.to_thread(validator.validate, resources)
+        if backend != "kubeconform":
+            raise HTTPError(400, f"Unknown validator '{backend}' (expected kubeconform or native)")
+        return await asyncio.to_thread(self.kubeconform, self.validator or K8sValidator(), resources)
+
+    # HTTP plumbing
+
+    async def dispatch(self, request: Request) -> Response:
+        handler = self.routes.get((request.method, request.path))
+        if handler is None:
+            if request.path in self.paths:
+                raise HTTPError(405, f"{request.method} not allowed on {request.path}")
+            raise HTTPError(404, f"No route for {request.path}")
+
+        # Health and metrics must answer even when the server is saturated
+        if request.path in ("/metrics", "/healthz"):
+            return await handler(request)
+
+        if self._semaphore.locked() and self._waiting >= self.max_pending:
+            self.metrics.rejected += 1
+            raise HTTPError(503, "Server busy, retry later")
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        self.metrics.in_flight += 1
+        try:
+            return await handler(request)
+        finally:
+            self.metrics.in_flight -= 1
+            self._semaphore.release()
+
+    async def read_request(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> Optional[Request]:
+        line = await asyncio.wait_for(reader.readline(), KEEP_ALIVE_TIMEOUT)
+        if not line.strip():
+            return None
+
+        # One deadline for the rest of the request, so a client trickling
+        # headers or body bytes cannot hold the connection open indefinitely
+        deadline = asyncio.get_running_loop().time() + REQUEST_TIMEOUT
+
+        def remaining() -> float:
+            return max(0.0, deadline - asyncio.get_running_loop().time())
+
+        try:
+            method, target, version = line.decode("latin-1").split()
+        except ValueError:
+            raise HTTPError(400, "Malformed request line")
+
+        headers = {"_version": version}
+        for _ in range(MAX_HEADERS):
+            header = await asyncio.wait_for(reader.readline(), remaining())
+            if header in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = header.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise HTTPError(400, "Too many headers")
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise HTTPError(411, "Chunked request bodies are not supported; send Content-Length")
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HTTPError(400, "Invalid Content-Length")
+        if length > MAX_BODY_BYTES:
+            raise HTTPError(413, f"Body larger than {MAX_BODY_BYTES} bytes")
+        if length and headers.get("expect", "").lower() == "100-continue":
+            writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+        body = await asyncio.wait_for(reader.readexactly(length), remaining()) if length else b""
+        return Request(method.upper(), target, headers, body)
+
+    @staticmethod
+    def keep_alive(request: Request) -> bool:
+        connection = request.headers.get("connection", "").lower()
+        if request.headers.get("_version") == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                endpoint = None
+                keep_alive = False
+                start = None
+                try:
+                    request = await self.read_request(reader, writer)
+                    if request is None:
+                        break
+                    start = time.perf_counter()
+                    endpoint = request.path
+                    keep_alive = self.keep_alive(request)
+                    response = await self.dispatch(request)
+                except HTTPError as e:
+                    response = Response.json({"error": e.message}, status=e.status)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except Exception as e:
+                    response = Response.json({"error": f"{type(e).__name__}: {e}"}, status=500)
+
+                self.write_response(writer, response, keep_alive)
+                await writer.drain()
+                if endpoint in self.paths:
+                    self.metrics.record(endpoint, response.status, time.perf_counter() - start)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def write_response(writer: asyncio.StreamWriter, response: Response, keep_alive: bool) -> None:
+        head = (
+            f"HTTP/1.1 {response.status} {REASONS.get(response.status, '')}\r\n"
+            f"Content-Type: {response.content_type}\r\n"
+            f"Content-Length: {len(response.body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            + "".join(f"{name}: {value}\r\n" for name, value in response.headers.items())
+            + "\r\n"
+        )
+        writer.write(head.encode("latin-1") + response.body)
+
+    async def start(self, host: str, port: int) -> asyncio.AbstractServer:
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    async def serve(self, host: str, port: int, ready=None) -> None:
+        server = await self.start(host, port)
+        if ready is not None:
+            ready(server)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            # The async client's connection pool is tied to this event loop
+            await self.llm_client.aclose()
+
+    def run(self, host: str, port: int, ready=None) -> None:
+        try:
+            asyncio.run(self.serve(host, port, ready))
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,72 @@
+import json
+from typing import Iterator, List, Optional
+
+
+class ResourceStreamParser:
+    """
+    Incremental JSON parser that yields each element of the top-level
+    "resources" array as soon as its closing brace arrives.
+
+    Only the structure needed to find object boundaries is tracked (nesting
+    depth, string/escape state and the current top-level key); each completed
+    object is then handed to json.loads on its own.
+    """
+
+    def __init__(self, key: str = "resources"):
+        self.key = key
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.array_depth: Optional[int] = None  # depth inside the target array
+        self.done = False
+        self._string: List[str] = []
+        self._last_string: Optional[str] = None
+        self._current_key: Optional[str] = None
+        self._object: Optional[List[str]] = None
+        self.count = 0
+
+    def feed(self, chunk: str) -> Iterator[dict]:
+        for ch in chunk:
+            if self._object is not None:
+                self._object.append(ch)
+
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == "\\":
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+                    if self.depth == 1:
+                        self._last_string = "".join(self._string)
+                elif self.depth == 1:
+                    self._string.append(ch)
+                continue
+
+            if ch == '"':
+                self.in_string = True
+                self._string = []
+            elif ch == ":" and self.depth == 1:
+                self._current_key = self._last_string
+            elif ch in "{[":
+                if (
+                    ch == "["
+                    and self.depth == 1
+                    and self.array_depth is None
+                    and not self.done
+                    and self._current_key == self.key
+                ):
+                    self.array_depth = 2
+                elif ch == "{" and self.array_depth is not None and self.depth == self.array_depth:
+                    self._object = ["{"]
+                self.depth += 1
+            elif ch in "}]":
+                self.depth -= 1
+                if self.array_depth is not None and self.depth == self.array_depth and ch == "}" and self._object is not None:
+                    text = "".join(self._object)
+                    self._object = None
+                    self.count += 1
+                    yield json.loads(text)
+                elif self.array_depth is not None and self.depth == self.array_depth - 1 and ch == "]":
+                    self.array_depth = None
+                    self.done = True
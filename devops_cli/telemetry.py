@@ -0,0 +1,115 @@
+import os
+import json
+import time
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class Span:
+    def __init__(self, name: str, parent: Optional["Span"], attrs: Dict[str, Any]):
+        self.name = name
+        self.parent = parent
+        self.depth = parent.depth + 1 if parent else 0
+        self.attrs = attrs
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.thread_id = threading.get_ident()
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    def set(self, key: str, value: Any) -> None:
+        self.attrs[key] = value
+
+    def add(self, key: str, amount: float = 1) -> None:
+        self.attrs[key] = self.attrs.get(key, 0) + amount
+
+
+class _NullSpan:
+    """
+    Returned when tracing is off, so instrumented code never has to check.
+    """
+    attrs: Dict[str, Any] = {}
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def add(self, key: str, amount: float = 1) -> None:
+        pass
+
+
+NULL_SPAN = _NullSpan()
+_current: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("devops_cli_span", default=None)
+
+
+class Tracer:
+    """
+    Records nested, timed spans for the generate pipeline. Disabled by
+    default; the CLI turns it on for --profile / --trace-file.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.spans: List[Span] = []
+        self.origin = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str, **attrs) -> Iterator[Any]:
+        if not self.enabled:
+            yield NULL_SPAN
+            return
+
+        span = Span(name, _current.get(), attrs)
+        self.spans.append(span)
+        token = _current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set("error", type(e).__name__)
+            raise
+        finally:
+            span.end = time.perf_counter()
+            _current.reset(token)
+
+    def reset(self) -> None:
+        self.spans = []
+        self.origin = time.perf_counter()
+
+    def chrome_trace(self) -> dict:
+        """
+        Chrome trace-event format (chrome://tracing, Perfetto); plain JSON, so
+        traces from many CI runs can also be aggregated directly.
+        """
+        pid = os.getpid()
+        events = [
+            {
+                "name": span.name,
+                "cat": "devops-cli",
+                "ph": "X",
+                "ts": (span.start - self.origin) * 1e6,
+                "dur": span.duration * 1e6,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": span.attrs,
+            }
+            for span in self.spans
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f, indent=2, default=str)
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def span(name: str, **attrs):
+    return _tracer.span(name, **attrs)
@@ -1,43 +1,247 @@
 import shutil
 import subprocess
 import os
-from tempfile import NamedTemporaryFile
-from devops_cli.models.internal import ValidationResult
+import json
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from devops_cli.config import cache_dir
+from devops_cli.fsutil import atomic_write
+from devops_cli.models.internal import ValidationIssue, ValidationResult
+from devops_cli.telemetry import span
+from devops_cli.validators.paths import format_path
+
+DEFAULT_SHARD_SIZE = 200  # files per kubeconform invocation
+MAX_CACHE_ENTRIES = 50000
+MANIFEST_EXTENSIONS = (".yaml", ".yml", ".json")
+KUSTOMIZATION_FILES = ("kustomization.yaml", "kustomization.yml", "Kustomization")
+
+
+class ValidationCache:
+    """
+    Per-file kubeconform results keyed by sha256(file content + validator
+    version key), so unchanged manifests are never revalidated. Stored as one
+    JSON file, merged and rewritten atomically on save. Safe to share between
+    threads (generate-batch and serve validate from worker threads).
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or cache_dir("kubeconform", "results.json")
+        self.entries: Dict[str, dict] = self._load()
+        self._dirty: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            return self.entries.get(key)
+
+    def set(self, key: str, entry: dict) -> None:
+        with self._lock:
+            self.entries[key] = entry
+            self._dirty[key] = entry
+
+    def save(self) -> None:
+        # Held for the whole merge + write so no thread's entries are lost in between
+        with self._lock:
+            self._save()
+
+    def _save(self) -> None:
+        if not self._dirty:
+            return
+        # Re-read so concurrent CLI runs don't drop each other's entries
+        merged = self._load()
+        for key, entry in self._dirty.items():
+            merged.pop(key, None)  # re-insert so the newest entries sit at the end
+            merged[key] = entry
+        if len(merged) > MAX_CACHE_ENTRIES:
+            merged = dict(list(merged.items())[-MAX_CACHE_ENTRIES:])
+        try:
+            atomic_write(self.path, json.dumps(merged))
+        except OSError:
+            return
+        self.entries = merged
+        self._dirty = {}
+
+
+def find_manifests(directory: str) -> List[str]:
+    if os.path.isfile(directory):
+        return [directory]
+    files = []
+    for root, dirs, names in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for name in sorted(names):
+            # kustomization.yaml is kustomize input, not a Kubernetes object
+            if name.endswith(MANIFEST_EXTENSIONS) and not name.startswith(".") and name not in KUSTOMIZATION_FILES:
+                files.append(os.path.join(root, name))
+    return files
+
+
+def pointer_to_path(pointer: str) -> str:
+    # kubeconform reports JSON pointers: /spec/template/spec/containers/0/image
+    parts = [int(p) if p.isdigit() else p for p in pointer.strip("/").split("/") if p]
+    return format_path(parts)
+
+
+def format_issue(issue: ValidationIssue) -> str:
+    where = issue.file or ""
+    if issue.kind:
+        where += f" - {issue.kind}/{issue.name}"
+    if issue.path:
+        where += f" {issue.path}"
+    return f"{where}: {issue.message}"
+
 
 class K8sValidator:
-    def __init__(self):
+    def __init__(
+        self,
+        kubernetes_version: Optional[str] = None,
+        cache: Optional[ValidationCache] = None,
+        use_cache: bool = True,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        max_workers: Optional[int] = None,
+    ):
         self.kubeconform_path = shutil.which("kubeconform")
+        self.kubernetes_version = kubernetes_version
+        self.use_cache = use_cache
+        self._cache = cache
+        self.shard_size = max(1, shard_size)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._version_key = None
+
+    @property
+    def cache(self) -> Optional[ValidationCache]:
+        if self.use_cache and self._cache is None:
+            self._cache = ValidationCache()
+        return self._cache if self.use_cache else None
+
+    def _base_cmd(self) -> List[str]:
+        cmd = [self.kubeconform_path, "-output", "json", "-verbose", "-ignore-missing-schemas"]
+        if self.kubernetes_version:
+            cmd += ["-kubernetes-version", self.kubernetes_version.lstrip("v")]
+        return cmd
+
+    @property
+    def version_key(self) -> str:
+        # Anything that can change a file's verdict without changing the file
+        if self._version_key is None:
+            try:
+                version = subprocess.run(
+                    [self.kubeconform_path, "-v"], capture_output=True, text=True
+                ).stdout.strip()
+            except OSError:
+                version = "unknown"
+            self._version_key = json.dumps([version, self._base_cmd()[1:]])
+        return self._version_key
+
+    def _file_key(self, path: str) -> str:
+        h = hashlib.sha256(self.version_key.encode("utf-8"))
+        with open(path, "rb") as f:
+            h.update(f.read())
+        return h.hexdigest()
+
+    def _run_shard(self, files: List[str]) -> Dict[str, dict]:
+        """
+        Runs one kubeconform process over a shard and returns per-file
+        results: {"resource_count": int, "issues": [ValidationIssue dicts]}.
+        """
+        results = {f: {"resource_count": 0, "issues": []} for f in files}
+        result = subprocess.run(self._base_cmd() + files, capture_output=True, text=True)
+
+        try:
+            report = json.loads(result.stdout)
+        except ValueError:
+            # Unparseable output: attribute the raw text to every file in the shard, uncached
+            lines = result.stderr.splitlines() + result.stdout.splitlines()
+            for f in files:
+                results[f]["issues"] = [ValidationIssue(message=line, file=f).model_dump() for line in lines]
+                results[f]["cacheable"] = False
+            return results
+
+        for res in report.get("resources") or []:
+            entry = results.setdefault(res.get("filename"), {"resource_count": 0, "issues": []})
+            status = res.get("status")
+            if status == "statusEmpty":
+                continue
+            entry["resource_count"] += 1
+            if status in ("statusValid", "statusSkipped"):
+                continue
+            base = dict(file=res.get("filename"), kind=res.get("kind") or None, name=res.get("name") or None)
+            validation_errors = res.get("validationErrors") or []
+            if validation_errors:
+                for err in validation_errors:
+                    entry["issues"].append(ValidationIssue(
+                        message=err.get("msg", ""), path=pointer_to_path(err.get("path", "")), **base
+                    ).model_dump())
+            else:
+                entry["issues"].append(ValidationIssue(message=res.get("msg") or status, **base).model_dump())
+        return results
 
     def validate(self, directory: str) -> ValidationResult:
+        with span("validator.kubeconform") as trace_span:
+            result = self._validate(directory, trace_span)
+            trace_span.set("valid", result.valid)
+            trace_span.set("resource_count", result.resource_count)
+            return result
+
+    def _validate(self, directory: str, trace_span) -> ValidationResult:
         if not self.kubeconform_path:
             return ValidationResult(
                 valid=False,
                 errors=["kubeconform binary not found in PATH. Please install it to enable validation."]
             )
 
-        # Run kubeconform on the directory
-        # -summary: print summary
-        # -output json: easier to parse if needed, but text is fine for CLI output usually.
-        # Let's stick to text capture for simplicity or simple exit code check.
-        
         try:
-            result = subprocess.run(
-                [self.kubeconform_path, "-summary", "-ignore-missing-schemas", directory],
-                capture_output=True,
-                text=True
-            )
-            
-            valid = (result.returncode == 0)
-            errors = []
-            if not valid:
-                errors = result.stderr.splitlines() + result.stdout.splitlines()
-            
-            # Count resources (naive count based on files in dir for now or parsing summary)
-            # Simplest for now is just return status
-            
+            files = find_manifests(directory)
+            cache = self.cache
+            per_file: Dict[str, dict] = {}
+            keys: Dict[str, str] = {}
+            pending = []
+            for f in files:
+                if cache is not None:
+                    keys[f] = self._file_key(f)
+                    hit = cache.get(keys[f])
+                    if hit is not None:
+                        # Cached issues are content-addressed; re-point them at this path
+                        per_file[f] = {
+                            "resource_count": hit["resource_count"],
+                            "issues": [dict(i, file=f) for i in hit["issues"]],
+                        }
+                        continue
+                pending.append(f)
+
+            # Shard changed files across parallel kubeconform processes
+            shards = [pending[i:i + self.shard_size] for i in range(0, len(pending), self.shard_size)]
+            trace_span.set("files", len(files))
+            trace_span.set("cached_files", len(files) - len(pending))
+            trace_span.set("shards", len(shards))
+            if shards:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(shards))) as pool:
+                    for shard_result in pool.map(self._run_shard, shards):
+                        per_file.update(shard_result)
+
+            if cache is not None:
+                for f in pending:
+                    entry = per_file.get(f)
+                    if entry is not None and entry.pop("cacheable", True):
+                        cache.set(keys[f], entry)
+                cache.save()
+
+            issues = [ValidationIssue(**i) for f in files for i in per_file.get(f, {}).get("issues", [])]
+            errors = [format_issue(issue) for issue in issues]
             return ValidationResult(
-                valid=valid,
-                errors=errors
+                valid=not issues,
+                errors=errors,
+                issues=issues,
+                resource_count=sum(per_file.get(f, {}).get("resource_count", 0) for f in files),
+                files_generated=files,
             )
 
         except Exception as e:
@@ -0,0 +1,116 @@
+import os
+import json
+from typing import Any, Dict, List, Optional
+from devops_cli.config import DEFAULT_KUBERNETES_VERSION, cache_dir
+from devops_cli.models.internal import ValidationIssue, ValidationResult
+from devops_cli.models.k8s import K8sResourceList, dump_resource
+from devops_cli.telemetry import span
+from devops_cli.validators.paths import format_path
+
+try:
+    import jsonschema
+except ImportError:  # optional dependency: pip install "devops-cli[native]"
+    jsonschema = None
+
+# Compiled schema validators, shared by every NativeValidator in the process.
+# Keyed by schema file path; None records a schema that does not exist.
+_COMPILED: Dict[str, Any] = {}
+
+
+def default_schema_location() -> str:
+    return os.getenv("DEVOPS_CLI_SCHEMA_DIR") or cache_dir("schemas")
+
+
+class NativeValidator:
+    """
+    Validates resource dicts in memory against a local Kubernetes JSON schema
+    bundle, laid out like yannh/kubernetes-json-schema:
+
+        <schema_location>/v1.29.0-standalone-strict/deployment-apps-v1.json
+
+    Schemas are compiled on first use and cached for the life of the process.
+    """
+
+    def __init__(
+        self,
+        kubernetes_version: Optional[str] = None,
+        schema_location: Optional[str] = None,
+        strict: bool = True,
+        ignore_missing_schemas: bool = True,
+    ):
+        self.kubernetes_version = (kubernetes_version or DEFAULT_KUBERNETES_VERSION).lstrip("v")
+        self.schema_location = schema_location or default_schema_location()
+        self.strict = strict
+        self.ignore_missing_schemas = ignore_missing_schemas
+
+    @property
+    def schema_dir(self) -> str:
+        suffix = "-standalone-strict" if self.strict else "-standalone"
+        return os.path.join(self.schema_location, f"v{self.kubernetes_version}{suffix}")
+
+    def schema_path(self, api_version: str, kind: str) -> str:
+        # apps/v1 -> deployment-apps-v1.json, networking.k8s.io/v1 -> ingress-networking-v1.json, v1 -> service-v1.json
+        if "/" in api_version:
+            group, version = api_version.split("/", 1)
+            filename = f"{kind}-{group.split('.')[0]}-{version}.json"
+        else:
+            filename = f"{kind}-{api_version}.json"
+        return os.path.join(self.schema_dir, filename.lower())
+
+    def _compiled(self, path: str):
+        if path not in _COMPILED:
+            try:
+                with open(path) as f:
+                    schema = json.load(f)
+            except FileNotFoundError:
+                _COMPILED[path] = None
+            else:
+                cls = jsonschema.validators.validator_for(schema)
+                _COMPILED[path] = cls(schema)
+        return _COMPILED[path]
+
+    def validate_resources(self, resources: List[dict]) -> ValidationResult:
+        if jsonschema is None:
+            return ValidationResult(
+                valid=False,
+                errors=["jsonschema is not installed. Install devops-cli[native] to enable native validation."]
+            )
+        if not os.path.isdir(self.schema_dir):
+            return ValidationResult(
+                valid=False,
+                errors=[f"Schema bundle {self.schema_dir} not found. Download it from yannh/kubernetes-json-schema or pass --schema-location."]
+            )
+
+        issues = []
+        for resource in resources:
+            kind = resource.get("kind")
+            name = (resource.get("metadata") or {}).get("name")
+            api_version = resource.get("apiVersion")
+            if not kind or not api_version:
+                issues.append(ValidationIssue(message="missing apiVersion or kind", kind=kind, name=name))
+                continue
+
+            validator = self._compiled(self.schema_path(api_version, kind))
+            if validator is None:
+                if not self.ignore_missing_schemas:
+                    issues.append(ValidationIssue(
+                        message=f"no schema for {api_version} {kind} in {self.schema_dir}", kind=kind, name=name
+                    ))
+                continue
+
+            for error in sorted(validator.iter_errors(resource), key=lambda e: list(map(str, e.absolute_path))):
+                issues.append(ValidationIssue(
+                    message=error.message, path=format_path(error.absolute_path), kind=kind, name=name
+                ))
+
+        errors = [
+            f"{issue.kind}/{issue.name}: {issue.path or '<root>'}: {issue.message}" for issue in issues
+        ]
+        return ValidationResult(valid=not issues, errors=errors, issues=issues, resource_count=len(resources))
+
+    def validate(self, resource_list: K8sResourceList) -> ValidationResult:
+        with span("validator.native", kubernetes_version=self.kubernetes_version) as trace_span:
+            result = self.validate_resources([dump_resource(resource) for resource in resource_list.resources])
+            trace_span.set("valid", result.valid)
+            trace_span.set("resource_count", result.resource_count)
+            return result
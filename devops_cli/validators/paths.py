@@ -0,0 +1,12 @@
+def format_path(parts) -> str:
+    """
+    Dotted field path from JSON path parts, e.g. spec.template.spec.containers[0].image.
+    Kept free of heavy imports so both validation backends can share it.
+    """
+    path = ""
+    for part in parts:
+        if isinstance(part, int):
+            path += f"[{part}]"
+        else:
+            path += f".{part}" if path else str(part)
+    return path
@@ -0,0 +1,371 @@
+import io
+from typing import Dict, Iterator, List, Optional, Tuple
+from ruamel.yaml import YAML
+from devops_cli.fsutil import atomic_write
+from devops_cli.models.internal import PolicyResult, PolicyViolation
+from devops_cli.models.k8s import (
+    Container,
+    ContainerProbe,
+    ContainerResourceLimit,
+    ContainerResourceRequest,
+    K8sCronJob,
+    K8sDaemonSet,
+    K8sDeployment,
+    K8sJob,
+    K8sResource,
+    K8sResourceAdapter,
+    K8sResourceList,
+    K8sStatefulSet,
+    PodTemplateSpec,
+    default_resources,
+    dump_resource,
+)
+from devops_cli.telemetry import span
+from devops_cli.validators.k8s_validator import find_manifests
+
+SEVERITIES = ("error", "warning", "info", "off")
+WORKLOAD_KINDS = ("Deployment", "StatefulSet", "DaemonSet", "Job", "CronJob")
+LONG_RUNNING_KINDS = ("Deployment", "StatefulSet", "DaemonSet")
+
+
+def pod_template(resource: K8sResource) -> Tuple[str, Optional[PodTemplateSpec]]:
+    if isinstance(resource, K8sCronJob):
+        return "spec.jobTemplate.spec.template", resource.spec.jobTemplate.spec.template
+    if isinstance(resource, (K8sDeployment, K8sStatefulSet, K8sDaemonSet, K8sJob)):
+        return "spec.template", resource.spec.template
+    return "", None
+
+
+def containers(resource: K8sResource) -> Iterator[Tuple[str, Container]]:
+    prefix, template = pod_template(resource)
+    if template is None:
+        return
+    for i, container in enumerate(template.spec.containers):
+        yield f"{prefix}.spec.containers[{i}]", container
+
+
+class PolicyRule:
+    """
+    One best-practice rule. check() yields (path, message) for every problem
+    in a resource; fix() repairs what it can in place. The engine re-checks
+    after fixing, so a fix only has to handle the cases it understands.
+    """
+
+    id = ""
+    description = ""
+    severity = "error"
+    kinds: Optional[Tuple[str, ...]] = None  # None applies the rule to every kind
+
+    def applies_to(self, resource: K8sResource) -> bool:
+        return self.kinds is None or resource.kind in self.kinds
+
+    def check(self, resource: K8sResource) -> Iterator[Tuple[str, str]]:
+        raise NotImplementedError
+
+    def fix(self, resource: K8sResource, environment: Optional[str] = None) -> None:
+        pass
+
+
+class ResourcesRule(PolicyRule):
+    id = "resources"
+    description = "Containers set resource requests and limits"
+    kinds = WORKLOAD_KINDS
+
+    def check(self, resource):
+        for path, container in containers(resource):
+            resources = container.resources
+            if resources is None or (resources.requests is None and resources.limits is None):
+                yield f"{path}.resources", f"container '{container.name}' sets no resource requests or limits"
+                continue
+            for part in ("requests", "limits"):
+                if getattr(resources, part) is None:
+                    yield f"{path}.resources.{part}", f"container '{container.name}' sets no resource {part}"
+
+    def fix(self, resource, environment=None):
+        for _, container in containers(resource):
+            resources = container.resources
+            if resources is None or (resources.requests is None and resources.limits is None):
+                container.resources = default_resources()
+            elif resources.requests is None:
+                # Kubernetes defaults missing requests to the limits; make that explicit
+                resources.requests = ContainerResourceRequest(**resources.limits.model_dump(exclude_none=True))
+            elif resources.limits is None:
+                resources.limits = ContainerResourceLimit(**resources.requests.model_dump(exclude_none=True))
+
+
+class ProbesRule(PolicyRule):
+    id = "probes"
+    description = "Long-running containers have liveness and readiness probes"
+    kinds = LONG_RUNNING_KINDS
+
+    def check(self, resource):
+        for path, container in containers(resource):
+            for probe in ("livenessProbe", "readinessProbe"):
+                if getattr(container, probe) is None:
+                    yield f"{path}.{probe}", f"container '{container.name}' has no {probe}"
+
+    def fix(self, resource, environment=None):
+        for _, container in containers(resource):
+            # Without a declared port there is nothing safe to probe
+            if not container.ports:
+                continue
+            port = container.ports[0].containerPort
+            if container.readinessProbe is None:
+                container.readinessProbe = ContainerProbe(tcpSocket={"port": port})
+            if container.livenessProbe is None:
+                container.livenessProbe = ContainerProbe(tcpSocket={"port": port}, initialDelaySeconds=15)
+
+
+class ImageTagRule(PolicyRule):
+    id = "image-tag"
+    description = "Images are pinned to a tag other than latest"
+    severity = "warning"
+    kinds = WORKLOAD_KINDS
+
+    def check(self, resource):
+        for path, container in containers(resource):
+            image = container.image
+            if "@" in image:
+                continue  # pinned by digest
+            name, _, tag = image.rpartition(":")
+            if not name or "/" in tag:
+                tag = ""  # the colon belonged to a registry port
+            if tag in ("", "latest"):
+                yield f"{path}.image", f"container '{container.name}' uses unpinned image '{image}'"
+
+
+class PrivilegedRule(PolicyRule):
+    id = "privileged"
+    description = "Containers are not privileged and cannot escalate privileges"
+    kinds = WORKLOAD_KINDS
+
+    def check(self, resource):
+        for path, container in containers(resource):
+            context = container.securityContext or {}
+            for key in ("privileged", "allowPrivilegeEscalation"):
+                if context.get(key) is True:
+                    yield f"{path}.securityContext.{key}", f"container '{container.name}' sets {key}: true"
+
+    def fix(self, resource, environment=None):
+        for _, container in containers(resource):
+            context = dict(container.securityContext or {})
+            changed = False
+            for key in ("privileged", "allowPrivilegeEscalation"):
+                if context.get(key) is True:
+                    context[key] = False
+                    changed = True
+            if changed:
+                container.securityContext = context
+
+
+class LabelsRule(PolicyRule):
+    id = "labels"
+    description = "Resources carry the standard app and environment labels"
+    required = ("app", "environment")
+
+    def __init__(self, required: Optional[Tuple[str, ...]] = None):
+        if required is not None:
+            self.required = required
+
+    def check(self, resource):
+        for key in self.required:
+            if key not in (resource.metadata.labels or {}):
+                yield "metadata.labels", f"missing label '{key}'"
+        prefix, template = pod_template(resource)
+        if template is not None:
+            for key in self.required:
+                if key not in (template.metadata.labels or {}):
+                    yield f"{prefix}.metadata.labels", f"pod template is missing label '{key}'"
+
+    def fix(self, resource, environment=None):
+        _, template = pod_template(resource)
+        targets = [resource.metadata]
+        if template is not None:
+            # Selectors are left alone: adding pod labels never breaks a selector match
+            targets.append(template.metadata)
+        app = (targets[-1].labels or {}).get("app") or resource.metadata.name
+        values = {"app": app, "environment": environment}
+        for metadata in targets:
+            labels = dict(metadata.labels or {})
+            for key in self.required:
+                if key not in labels and values.get(key):
+                    labels[key] = values[key]
+            if labels:
+                metadata.labels = labels
+
+
+class ServiceTypeRule(PolicyRule):
+    id = "service-type"
+    description = "Services stay ClusterIP unless exposure was asked for"
+    severity = "info"
+    kinds = ("Service",)
+
+    def check(self, resource):
+        if resource.spec.type in ("NodePort", "LoadBalancer"):
+            yield "spec.type", f"service is exposed outside the cluster ({resource.spec.type})"
+
+
+def default_rules(labels: Optional[Tuple[str, ...]] = None) -> List[PolicyRule]:
+    """labels overrides the label keys LabelsRule requires, e.g. ("app",) for a kustomize base."""
+    return [ResourcesRule(), ProbesRule(), ImageTagRule(), PrivilegedRule(), LabelsRule(labels), ServiceTypeRule()]
+
+
+def load_policy_config(path: str) -> Dict[str, str]:
+    """
+    Reads per-rule severities from YAML/JSON, either a mapping of rule id to
+    severity or the same mapping under 'rules', e.g. {"image-tag": "error"}.
+    """
+    with open(path) as f:
+        data = YAML(typ="safe").load(f) or {}
+    if "rules" in data:
+        data = data["rules"] or {}
+    return {rule: str(severity).lower() for rule, severity in data.items()}
+
+
+class PolicyEngine:
+    """
+    Checks validated resources against best-practice rules in memory and,
+    with fix=True, repairs them in place with deterministic defaults.
+    """
+
+    def __init__(
+        self,
+        rules: Optional[List[PolicyRule]] = None,
+        severities: Optional[Dict[str, str]] = None,
+        environment: Optional[str] = None,
+    ):
+        self.rules = rules if rules is not None else default_rules()
+        self.severities = severities or {}
+        self.environment = environment  # used when adding a missing environment label
+
+        known = {rule.id for rule in self.rules}
+        for rule_id, severity in self.severities.items():
+            if rule_id not in known:
+                raise ValueError(f"Unknown policy rule '{rule_id}' (known: {', '.join(sorted(known))})")
+            if severity not in SEVERITIES:
+                raise ValueError(f"Invalid severity '{severity}' for rule '{rule_id}' (expected one of {', '.join(SEVERITIES)})")
+
+    def severity(self, rule: PolicyRule) -> str:
+        return self.severities.get(rule.id, rule.severity)
+
+    def check_resource(self, resource: K8sResource, fix: bool = False, file: Optional[str] = None) -> List[PolicyViolation]:
+        violations = []
+        for rule in self.rules:
+            severity = self.severity(rule)
+            if severity == "off" or not rule.applies_to(resource):
+                continue
+            found = list(rule.check(resource))
+            if not found:
+                continue
+            # Without fix the rule repairs a copy, only to tell which violations --fix would repair
+            target = resource if fix else resource.model_copy(deep=True)
+            rule.fix(target, self.environment)
+            remaining = list(rule.check(target))
+            for path, message in found:
+                violations.append(PolicyViolation(
+                    rule=rule.id,
+                    severity=severity,
+                    message=message,
+                    path=path,
+                    kind=resource.kind,
+                    name=resource.metadata.name,
+                    file=file,
+                    fixed=fix and (path, message) not in remaining,
+                    fixable=(path, message) not in remaining,
+                ))
+        return violations
+
+    def check(self, resource_list: K8sResourceList, fix: bool = False) -> PolicyResult:
+        with span("policy.check", resource_count=len(resource_list.resources), fix=fix) as trace_span:
+            violations = []
+            for resource in resource_list.resources:
+                violations += self.check_resource(resource, fix=fix)
+            result = summarize(violations, len(resource_list.resources))
+            trace_span.set("violations", len(violations))
+            trace_span.set("fixed", result.fixed_count)
+        return result
+
+
+def summarize(violations: List[PolicyViolation], resource_count: int) -> PolicyResult:
+    return PolicyResult(
+        valid=not any(v.severity == "error" and not v.fixed for v in violations),
+        violations=violations,
+        resource_count=resource_count,
+        fixed_count=sum(1 for v in violations if v.fixed),
+    )
+
+
+def _patch(node, before, after) -> None:
+    """
+    Applies the difference between two dumps of a resource onto its loaded
+    round-trip YAML node, so everything the fix did not touch (key order,
+    quoting, comments, fields the models never saw) stays as written.
+    """
+    for key, value in after.items():
+        old = before.get(key)
+        if key in before and old == value:
+            continue
+        current = node.get(key) if key in node else None
+        if isinstance(value, dict) and isinstance(old, dict) and isinstance(current, dict):
+            _patch(current, old, value)
+        elif (
+            isinstance(value, list) and isinstance(old, list) and isinstance(current, list)
+            and len(value) == len(old) == len(current)
+        ):
+            for i, (old_item, new_item) in enumerate(zip(old, value)):
+                if isinstance(old_item, dict) and isinstance(new_item, dict) and isinstance(current[i], dict):
+                    _patch(current[i], old_item, new_item)
+                elif old_item != new_item:
+                    current[i] = new_item
+        else:
+            node[key] = value
+    for key in before:
+        if key not in after and key in node:
+            del node[key]
+
+
+def lint_directory(engine: PolicyEngine, directory: str, fix: bool = False) -> PolicyResult:
+    """
+    Runs the engine over existing manifests (multi-document files included).
+    With fix, only files in which something was fixed are rewritten, and only
+    the fixed fields change in them.
+    """
+    yaml = YAML()
+    yaml.preserve_quotes = True
+    yaml.indent(mapping=2, sequence=4, offset=2)
+    violations: List[PolicyViolation] = []
+    resource_count = 0
+
+    with span("policy.lint", directory=directory, fix=fix) as trace_span:
+        for path in find_manifests(directory):
+            try:
+                with open(path) as f:
+                    text = f.read()
+                documents = [doc for doc in yaml.load_all(text) if doc]
+                resources = [K8sResourceAdapter.validate_python(doc) for doc in documents]
+            except Exception as e:
+                violations.append(PolicyViolation(
+                    rule="parse", severity="error", message=f"cannot read manifest: {e}", file=path
+                ))
+                continue
+
+            resource_count += len(resources)
+            file_violations = []
+            for document, resource in zip(documents, resources):
+                before = dump_resource(resource) if fix else None
+                found = engine.check_resource(resource, fix=fix, file=path)
+                if any(v.fixed for v in found):
+                    _patch(document, before, dump_resource(resource))
+                file_violations += found
+            violations += file_violations
+
+            if fix and any(v.fixed for v in file_violations):
+                yaml.explicit_start = text.lstrip().startswith("---")
+                buf = io.StringIO()
+                yaml.dump_all(documents, buf)
+                atomic_write(path, buf.getvalue())
+
+        result = summarize(violations, resource_count)
+        trace_span.set("resource_count", resource_count)
+        trace_span.set("violations", len(violations))
+    return result
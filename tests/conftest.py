@@ -0,0 +1,16 @@
+import threading
+from http.server import ThreadingHTTPServer
+import pytest
+from tests.stub_openai import StubOpenAI
+
+
+@pytest.fixture
+def openai_url():
+    StubOpenAI.reset()
+    stub = ThreadingHTTPServer(("127.0.0.1", 0), StubOpenAI)
+    thread = threading.Thread(target=stub.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{stub.server_address[1]}/v1"
+    StubOpenAI.release.set()
+    stub.shutdown()
+    stub.server_close()
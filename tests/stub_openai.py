@@ -0,0 +1,116 @@
+"""
+A local stand-in for the OpenAI chat completions endpoint, so generation can
+be tested without network access (see the openai_url fixture in conftest.py).
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+RESOURCES = {"resources": [
+    {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {"name": "web", "labels": {"app": "web"}},
+        "spec": {
+            "selector": {"matchLabels": {"app": "web"}},
+            "template": {
+                "metadata": {"labels": {"app": "web"}},
+                "spec": {"containers": [{"name": "web", "image": "nginx:1.25"}]},
+            },
+        },
+    },
+]}
+
+
+class StubOpenAI(BaseHTTPRequestHandler):
+    """
+    Chat completions endpoint (streamed when asked): prompts containing FAIL get a 400, prompts
+    containing RATE get one 429 before succeeding, prompts containing SLOW
+    wait for `release`. Every answer takes `delay` seconds, and the most
+    requests seen in flight at once is kept in `max_in_flight`.
+    """
+
+    protocol_version = "HTTP/1.1"
+    release = threading.Event()
+    lock = threading.Lock()
+    delay = 0.0
+    calls = 0
+    in_flight = 0
+    max_in_flight = 0
+    rate_limited: set = set()
+
+    @classmethod
+    def reset(cls):
+        cls.release.clear()
+        cls.delay = 0.0
+        cls.calls = cls.in_flight = cls.max_in_flight = 0
+        cls.rate_limited = set()
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["content-length"])))
+        prompt = body["messages"][1]["content"]
+        cls = type(self)
+        with cls.lock:
+            cls.calls += 1
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            self.answer(prompt, stream=body.get("stream", False))
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def answer(self, prompt, stream=False):
+        time.sleep(self.delay)
+        if "FAIL" in prompt:
+            self.send_json(400, {"error": {"message": "bad request"}})
+            return
+        if "RATE" in prompt and prompt not in self.rate_limited:
+            self.rate_limited.add(prompt)
+            self.send_json(429, {"error": {"message": "rate limited"}}, {"Retry-After": "0.01"})
+            return
+        if "SLOW" in prompt:
+            self.release.wait(10)
+        if stream:
+            self.send_stream(json.dumps(RESOURCES))
+            return
+        self.send_json(200, {
+            "id": "stub", "object": "chat.completion", "created": 0, "model": "stub",
+            "choices": [{
+                "index": 0, "finish_reason": "stop",
+                "message": {"role": "assistant", "content": json.dumps(RESOURCES)},
+            }],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        })
+
+    def send_stream(self, content, size=16):
+        """Server-sent events, `size` characters of content per chunk."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        events = [
+            {"id": "stub", "object": "chat.completion.chunk", "created": 0, "model": "stub",
+             "choices": [{"index": 0, "delta": {"content": content[i:i + size]}, "finish_reason": None}]}
+            for i in range(0, len(content), size)
+        ]
+        events.append({"id": "stub", "object": "chat.completion.chunk", "created": 0, "model": "stub", "choices": [],
+                       "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}})
+        for data in [json.dumps(event) for event in events] + ["[DONE]"]:
+            payload = f"data: {data}\n\n".encode()
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(payload), payload))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def send_json(self, status, data, headers=None):
+        out = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(out)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(out)
@@ -0,0 +1,58 @@
+import json
+from devops_cli.generators.batch import BatchGenerator, InvalidBatchEntry, load_batch_file
+from devops_cli.generators.k8s_generator import K8sGenerator
+from devops_cli.generators.templates import TemplateBackend
+from devops_cli.llm_client import LLMClient
+from devops_cli.renderers.yaml_renderer import YamlRenderer
+from tests.stub_openai import StubOpenAI
+
+
+def batch(openai_url, concurrency, backends=None):
+    llm_client = LLMClient(api_key="stub", base_url=openai_url, cache=None, max_retries=2)
+    return BatchGenerator(K8sGenerator(llm_client, backends=backends), YamlRenderer(), concurrency=concurrency)
+
+
+def write_jsonl(path, lines):
+    path.write_text("".join(line + "\n" for line in lines))
+    return str(path)
+
+
+def test_invalid_entries_fail_alone(tmp_path):
+    path = write_jsonl(tmp_path / "batch.jsonl", [
+        json.dumps({"name": "ok", "prompt": "web"}),
+        json.dumps({"name": "bad-replicas", "prompt": "web", "replicas": "bad"}),
+        "{not json",
+    ])
+    items = load_batch_file(path)
+    assert not isinstance(items[0], InvalidBatchEntry)
+    assert isinstance(items[1], InvalidBatchEntry) and items[1].name == "bad-replicas"
+    assert isinstance(items[2], InvalidBatchEntry) and "line 3" in items[2].error
+
+
+def test_batch_isolates_failures_and_retries_rate_limits(openai_url, tmp_path):
+    items = load_batch_file(write_jsonl(tmp_path / "batch.jsonl", [
+        json.dumps({"name": "web", "prompt": "web frontend"}),
+        json.dumps({"name": "rate", "prompt": "RATE limited api"}),
+        json.dumps({"name": "fail", "prompt": "FAIL please"}),
+        json.dumps({"name": "invalid", "prompt": "web", "replicas": "bad"}),
+        json.dumps({"name": "nginx", "prompt": "nginx deployment"}),
+    ]))
+    results = {r.name: r for r in batch(openai_url, 2, [TemplateBackend()]).run(items, str(tmp_path / "out"))}
+
+    assert results["web"].success and results["web"].backend == "llm"
+    assert results["rate"].success  # retried after the 429
+    assert results["nginx"].success and results["nginx"].backend == "template"
+    assert not results["fail"].success and results["fail"].error
+    assert not results["invalid"].success and "invalid request" in results["invalid"].error
+    assert (tmp_path / "out" / "web" / "web-deployment.yaml").exists()
+
+
+def test_batch_concurrency_is_bounded(openai_url, tmp_path):
+    StubOpenAI.delay = 0.05
+    items = load_batch_file(write_jsonl(
+        tmp_path / "batch.jsonl", [json.dumps({"name": f"item-{i}", "prompt": f"web {i}"}) for i in range(8)]
+    ))
+    results = batch(openai_url, 3).run(items, str(tmp_path / "out"))
+    assert all(r.success for r in results)
+    assert StubOpenAI.calls == 8
+    assert 1 < StubOpenAI.max_in_flight <= 3
@@ -0,0 +1,50 @@
+from devops_cli.generators.backends import GeneratorBackend
+from devops_cli.generators.k8s_generator import K8sGenerator
+from devops_cli.generators.templates import TemplateBackend, match_prompt
+from devops_cli.models.internal import GenerationRequest
+from devops_cli.models.k8s import DeploymentSpec
+
+
+class InvalidBackend(GeneratorBackend):
+    name = "invalid"
+
+    def generate(self, request):
+        DeploymentSpec.model_validate({"replicas": -1})
+
+
+def generator(*backends):
+    # The LLM client is never reached by these tests
+    return K8sGenerator(llm_client=object(), backends=list(backends))
+
+
+def test_backend_validation_error_falls_through_to_llm():
+    gen = generator(InvalidBackend())
+    assert gen.try_backends(GenerationRequest(prompt="nginx")) is None
+    assert gen.last_backend == "llm"
+
+
+def test_next_backend_answers_after_a_failing_one():
+    gen = generator(InvalidBackend(), TemplateBackend())
+    resources = gen.try_backends(GenerationRequest(prompt="nginx deployment with 0 replicas"))
+    assert gen.last_backend == "template"
+    assert resources.resources[0].spec.replicas == 0
+
+
+def test_environment_neutral_request_has_no_environment_label():
+    gen = generator(TemplateBackend())
+    resources = gen.try_backends(GenerationRequest(prompt="nginx deployment", environment=None))
+    deployment = resources.resources[0]
+    assert deployment.metadata.labels == {"app": "nginx"}
+    assert deployment.spec.template.metadata.labels == {"app": "nginx"}
+    assert "Environment: none" in gen.build_user_prompt(GenerationRequest(prompt="nginx", environment=None))
+
+
+def test_image_keeps_its_case():
+    m = match_prompt("nginx image MyReg/App:V1")
+    assert m.image == "MyReg/App:V1"
+
+
+def test_invalid_names_fall_back_to_llm():
+    for name in ("foo/bar", "web.v2", "a/../../etc", "Web"):
+        assert match_prompt(f"nginx named {name}") is None
+    assert match_prompt("nginx named web-2").name == "web-2"
@@ -0,0 +1,54 @@
+from devops_cli.models.k8s import K8sResourceAdapter, dump_resource
+
+
+def deployment(container):
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {"name": "web"},
+        "spec": {
+            "selector": {"matchLabels": {"app": "web"}},
+            "template": {
+                "metadata": {"labels": {"app": "web"}},
+                "spec": {"containers": [container]},
+            },
+        },
+    }
+
+
+def round_trip(data):
+    return dump_resource(K8sResourceAdapter.validate_python(data))
+
+
+def test_minimal_deployment_round_trips_unchanged():
+    data = deployment({"name": "web", "image": "nginx:1.25"})
+    assert round_trip(data) == data
+
+
+def test_partial_resources_are_not_filled_in():
+    limits_only = deployment({"name": "web", "image": "nginx:1.25", "resources": {"limits": {"cpu": "1", "memory": "1Gi"}}})
+    gpu_only = deployment({"name": "web", "image": "cuda:12", "resources": {"limits": {"nvidia.com/gpu": "1"}}})
+    assert round_trip(limits_only) == limits_only
+    assert round_trip(gpu_only) == gpu_only
+
+
+def test_service_and_configmap_round_trip_unchanged():
+    service = {
+        "apiVersion": "v1",
+        "kind": "Service",
+        "metadata": {"name": "web"},
+        "spec": {"selector": {"app": "web"}, "ports": [{"port": 80, "targetPort": 80}]},
+    }
+    configmap = {"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": "web"}}
+    assert round_trip(service) == service
+    assert round_trip(configmap) == configmap
+
+
+def test_numeric_quantities_and_zero_replicas_are_accepted():
+    data = deployment({
+        "name": "web",
+        "image": "nginx:1.25",
+        "resources": {"requests": {"cpu": 1, "memory": "1Gi"}, "limits": {"cpu": 2.5}},
+    })
+    data["spec"]["replicas"] = 0
+    assert round_trip(data) == data
@@ -0,0 +1,129 @@
+from devops_cli.models.k8s import K8sResourceAdapter, K8sResourceList, dump_resource
+from devops_cli.validators.policy import LabelsRule, PolicyEngine, PrivilegedRule, ProbesRule, ResourcesRule, lint_directory
+
+
+def deployment(resources=None):
+    container = {"name": "web", "image": "nginx:1.25"}
+    if resources is not None:
+        container["resources"] = resources
+    return K8sResourceAdapter.validate_python({
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {"name": "web", "labels": {"app": "web"}},
+        "spec": {
+            "selector": {"matchLabels": {"app": "web"}},
+            "template": {
+                "metadata": {"labels": {"app": "web"}},
+                "spec": {"containers": [container]},
+            },
+        },
+    })
+
+
+def container_resources(resource):
+    return dump_resource(resource)["spec"]["template"]["spec"]["containers"][0].get("resources")
+
+
+def fix_resources(resource):
+    engine = PolicyEngine(rules=[ResourcesRule()])
+    result = engine.check(K8sResourceList(resources=[resource]), fix=True)
+    return result, container_resources(resource)
+
+
+def test_missing_resources_are_fixed_in_the_output():
+    resource = deployment()
+    assert container_resources(resource) is None
+    result, resources = fix_resources(resource)
+    assert result.valid and result.fixed_count == 1
+    assert resources == {
+        "requests": {"cpu": "100m", "memory": "128Mi"},
+        "limits": {"cpu": "500m", "memory": "512Mi"},
+    }
+
+
+def test_limits_only_gets_matching_requests():
+    result, resources = fix_resources(deployment({"limits": {"cpu": "1", "memory": "1Gi"}}))
+    assert result.valid
+    assert resources == {"limits": {"cpu": "1", "memory": "1Gi"}, "requests": {"cpu": "1", "memory": "1Gi"}}
+
+
+def test_complete_resources_pass_untouched():
+    given = {"requests": {"cpu": "250m", "memory": "256Mi"}, "limits": {"cpu": 1, "memory": "1Gi"}}
+    result, resources = fix_resources(deployment(given))
+    assert result.violations == []
+    assert resources == given
+
+
+MANIFEST = """\
+# Web frontend
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: web  # keep this name
+spec:
+  selector:
+    matchLabels:
+      app: web
+  template:
+    metadata:
+      labels:
+        app: web
+    spec:
+      containers:
+        - name: web
+          image: "nginx:1.25"
+          securityContext:
+            privileged: true
+"""
+
+
+def test_lint_fix_only_patches_fixed_fields(tmp_path):
+    path = tmp_path / "web.yaml"
+    path.write_text(MANIFEST)
+    result = lint_directory(PolicyEngine(rules=[PrivilegedRule()]), str(tmp_path), fix=True)
+    assert result.valid and result.fixed_count == 1
+    assert path.read_text() == MANIFEST.replace("privileged: true", "privileged: false")
+
+
+def test_lint_fix_leaves_other_containers_alone(tmp_path):
+    manifest = MANIFEST + """\
+        - name: sidecar
+          image: "busybox:1.36"
+"""
+    path = tmp_path / "web.yaml"
+    path.write_text(manifest)
+    result = lint_directory(PolicyEngine(rules=[PrivilegedRule()]), str(tmp_path), fix=True)
+    assert result.fixed_count == 1
+    assert path.read_text() == manifest.replace("privileged: true", "privileged: false")
+
+
+def test_lint_without_fixes_leaves_file_alone(tmp_path):
+    path = tmp_path / "web.yaml"
+    path.write_text(MANIFEST.replace("privileged: true", "privileged: false"))
+    before = path.stat().st_mtime_ns
+    result = lint_directory(PolicyEngine(rules=[PrivilegedRule()]), str(tmp_path), fix=True)
+    assert result.violations == []
+    assert path.stat().st_mtime_ns == before
+
+
+def test_unfixable_violations_are_not_reported_as_fixable():
+    resource = deployment({"requests": {"cpu": "100m"}, "limits": {"cpu": "1"}})  # no ports to probe
+    result = PolicyEngine(rules=[ProbesRule()]).check(K8sResourceList(resources=[resource]))
+    assert result.violations and not any(v.fixable for v in result.violations)
+    fixed = PolicyEngine(rules=[ProbesRule()]).check(K8sResourceList(resources=[resource]), fix=True)
+    assert fixed.fixed_count == 0 and not fixed.valid
+
+
+def test_check_without_fix_leaves_resource_untouched():
+    resource = deployment()
+    result = PolicyEngine(rules=[ResourcesRule()]).check(K8sResourceList(resources=[resource]))
+    assert [v.fixable for v in result.violations] == [True]
+    assert not result.violations[0].fixed
+    assert container_resources(resource) is None
+
+
+def test_custom_required_labels_are_reported_not_invented():
+    resource = deployment()
+    result = PolicyEngine(rules=[LabelsRule(("app", "team"))]).check(K8sResourceList(resources=[resource]), fix=True)
+    assert [v.path for v in result.violations if not v.fixed] == ["metadata.labels", "spec.template.metadata.labels"]
+    assert resource.metadata.labels == {"app": "web"}
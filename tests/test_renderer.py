@@ -0,0 +1,28 @@
+import os
+from devops_cli.generators.templates import TemplateBackend
+from devops_cli.models.internal import EnvironmentProfile, GenerationRequest
+from devops_cli.renderers.yaml_renderer import YamlRenderer
+
+
+def test_prune_removes_overlays_of_dropped_environments(tmp_path):
+    resources = TemplateBackend().generate(GenerationRequest(prompt="nginx deployment", environment=None))
+    output = str(tmp_path)
+    YamlRenderer().render_overlays(
+        resources, output, [EnvironmentProfile(name="dev"), EnvironmentProfile(name="prod")], prune=True
+    )
+    assert os.path.exists(tmp_path / "overlays" / "prod" / "kustomization.yaml")
+
+    renderer = YamlRenderer()
+    renderer.render_overlays(resources, output, [EnvironmentProfile(name="dev")], prune=True)
+    assert not os.path.exists(tmp_path / "overlays" / "prod")
+    assert os.path.exists(tmp_path / "overlays" / "dev" / "kustomization.yaml")
+    assert os.path.exists(tmp_path / "base" / "nginx-deployment.yaml")
+    assert renderer.stats["pruned"] == 1
+
+
+def test_overlays_are_kept_without_prune(tmp_path):
+    resources = TemplateBackend().generate(GenerationRequest(prompt="nginx deployment", environment=None))
+    output = str(tmp_path)
+    YamlRenderer().render_overlays(resources, output, [EnvironmentProfile(name="dev"), EnvironmentProfile(name="prod")])
+    YamlRenderer().render_overlays(resources, output, [EnvironmentProfile(name="dev")])
+    assert os.path.exists(tmp_path / "overlays" / "prod" / "kustomization.yaml")
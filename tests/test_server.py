@@ -0,0 +1,171 @@
+import asyncio
+import json
+from devops_cli import server as server_module
+from devops_cli.generators.templates import TemplateBackend
+from devops_cli.llm_client import LLMClient
+from devops_cli.server import DevopsServer
+from devops_cli.validators.native_validator import NativeValidator
+from tests.stub_openai import RESOURCES, StubOpenAI
+
+def run_server(test, openai_url="http://127.0.0.1:9/v1", **kwargs):
+    """Runs `test(port, devops_server)` against a DevopsServer on an ephemeral port."""
+
+    async def main():
+        llm_client = LLMClient(api_key="stub", base_url=openai_url, cache=None, max_retries=0)
+        devops_server = DevopsServer(llm_client=llm_client, **kwargs)
+        server = await devops_server.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            return await test(port, devops_server)
+        finally:
+            server.close()
+            await server.wait_closed()
+            await llm_client.aclose()
+
+    return asyncio.run(main())
+
+
+async def exchange(reader, writer, method, path, body=None, headers=None):
+    """Sends one request on an open connection and reads the response."""
+    payload = json.dumps(body).encode() if body is not None else b""
+    head = f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(payload)}\r\n"
+    head += "".join(f"{name}: {value}\r\n" for name, value in (headers or {}).items())
+    writer.write(head.encode() + b"\r\n" + payload)
+    await writer.drain()
+
+    status_line = await reader.readline()
+    response_headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode().partition(":")
+        response_headers[name.strip().lower()] = value.strip()
+    content = await reader.readexactly(int(response_headers["content-length"]))
+    return int(status_line.split()[1]), response_headers, content
+
+
+async def fetch(port, method, path, body=None, headers=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        return await exchange(reader, writer, method, path, body, {"Connection": "close", **(headers or {})})
+    finally:
+        writer.close()
+
+
+def test_routing():
+    async def test(port, _):
+        status, _, content = await fetch(port, "GET", "/healthz")
+        assert status == 200 and json.loads(content) == {"status": "ok"}
+        assert (await fetch(port, "GET", "/nowhere"))[0] == 404
+        assert (await fetch(port, "GET", "/v1/generate"))[0] == 405
+        status, _, content = await fetch(port, "GET", "/metrics")
+        assert status == 200 and json.loads(content)["endpoints"]["/healthz"]["count"] == 1
+
+    run_server(test)
+
+
+def test_keep_alive_serves_several_requests_on_one_connection():
+    async def test(port, _):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        first = await exchange(reader, writer, "GET", "/healthz")
+        second = await exchange(reader, writer, "POST", "/v1/render", RESOURCES)
+        writer.close()
+        assert first[0] == 200 and first[1]["connection"] == "keep-alive"
+        assert second[0] == 200 and b"kind: Deployment" in second[2]
+
+    run_server(test)
+
+
+def test_generate_with_template_backend():
+    async def test(port, _):
+        status, _, content = await fetch(port, "POST", "/v1/generate", {"prompt": "nginx deployment"})
+        data = json.loads(content)
+        assert status == 200 and data["backend"] == "template"
+        assert data["policy"]["valid"]
+
+    run_server(test, backends=[TemplateBackend()])
+
+
+def test_generate_yaml_keeps_policy_and_validation(tmp_path):
+    async def test(port, _):
+        path = "/v1/generate?format=yaml&validate=1&validator=native"
+        return await fetch(port, "POST", path, {"prompt": "nginx deployment"})
+
+    status, headers, content = run_server(
+        test, backends=[TemplateBackend()], native_validator=NativeValidator(schema_location=str(tmp_path))
+    )
+    text = content.decode()
+    assert status == 200 and headers["content-type"] == "application/yaml"
+    assert headers["x-policy-valid"] == "true"
+    # No schema bundle in tmp_path, so validation reports a failure
+    assert headers["x-validation-valid"] == "false"
+    assert text.startswith("# policy: passed") and "# validation: failed" in text
+    assert "kind: Deployment" in text
+
+
+def test_generate_with_llm(openai_url):
+    async def test(port, _):
+        return await fetch(port, "POST", "/v1/generate?fix=1", {"prompt": "a web frontend"})
+
+    status, _, content = run_server(test, openai_url=openai_url)
+    data = json.loads(content)
+    assert status == 200 and data["backend"] == "llm"
+    assert data["resources"][0]["metadata"]["name"] == "web"
+    assert data["policy"]["fixed_count"] > 0
+
+
+def test_errors(openai_url):
+    async def test(port, _):
+        bad_resource = await fetch(port, "POST", "/v1/render", {"resources": [{"kind": "Deployment"}]})
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"POST /v1/generate HTTP/1.1\r\nContent-Length: 5\r\nConnection: close\r\n\r\n{bad}")
+        invalid = await reader.read()
+        writer.close()
+        unprocessable = await fetch(port, "POST", "/v1/generate", {"environment": "dev"})
+        upstream = await fetch(port, "POST", "/v1/generate", {"prompt": "FAIL please"})
+        bad_format = await fetch(port, "POST", "/v1/render?format=xml", RESOURCES)
+        return bad_resource, invalid, unprocessable, upstream, bad_format
+
+    bad_resource, invalid, unprocessable, upstream, bad_format = run_server(test, openai_url=openai_url)
+    assert bad_resource[0] == 422
+    assert invalid.startswith(b"HTTP/1.1 400")
+    assert unprocessable[0] == 422
+    assert upstream[0] == 502 and b"Generation failed" in upstream[2]
+    assert bad_format[0] == 400
+
+
+def test_back_pressure_rejects_with_503_and_health_stays_up(openai_url):
+    async def test(port, devops_server):
+        slow = asyncio.ensure_future(fetch(port, "POST", "/v1/generate", {"prompt": "SLOW web"}))
+        while devops_server.metrics.in_flight == 0:
+            await asyncio.sleep(0.01)
+        rejected = await fetch(port, "POST", "/v1/render", RESOURCES)
+        health = await fetch(port, "GET", "/healthz")
+        StubOpenAI.release.set()
+        return rejected, health, await slow, devops_server.metrics.rejected
+
+    rejected, health, slow, rejected_count = run_server(test, openai_url=openai_url, concurrency=1, max_pending=0)
+    assert rejected[0] == 503 and rejected_count == 1
+    assert health[0] == 200
+    assert slow[0] == 200
+
+
+def test_stalled_headers_and_body_time_out(monkeypatch):
+    monkeypatch.setattr(server_module, "REQUEST_TIMEOUT", 0.2)
+
+    async def stalled(port, data):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(data)
+        await writer.drain()
+        closed = await asyncio.wait_for(reader.read(), 2)
+        writer.close()
+        return closed
+
+    async def test(port, _):
+        # The server closes both connections without answering
+        assert await stalled(port, b"GET /healthz HTTP/1.1\r\nHost: x\r\n") == b""
+        body_pending = b"POST /v1/render HTTP/1.1\r\nContent-Length: 100\r\n\r\n{"
+        assert await stalled(port, body_pending) == b""
+
+    run_server(test)
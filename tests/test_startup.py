@@ -0,0 +1,37 @@
+import os
+import re
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Cumulative import time of devops_cli.cli; override on slow CI machines
+STARTUP_BUDGET_MS = float(os.getenv("DEVOPS_CLI_STARTUP_BUDGET_MS", "150"))
+HEAVY_MODULES = ("openai", "pydantic", "ruamel", "jsonschema")
+
+
+def import_times():
+    """
+    Returns {module: cumulative microseconds} from python -X importtime.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import devops_cli.cli"],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        match = re.match(r"import time:\s*\d+\s*\|\s*(\d+)\s*\|\s*(\S+)", line)
+        if match:
+            times[match.group(2)] = int(match.group(1))
+    return times
+
+
+def test_cli_import_skips_heavy_dependencies():
+    imported = import_times()
+    heavy = sorted(m for m in imported if m.split(".")[0] in HEAVY_MODULES)
+    assert heavy == []
+
+
+def test_cli_import_within_budget():
+    # Best of three runs, so one noisy run does not fail the suite
+    best = min(import_times()["devops_cli.cli"] for _ in range(3)) / 1000
+    assert best <= STARTUP_BUDGET_MS, f"import devops_cli.cli took {best:.1f} ms (budget {STARTUP_BUDGET_MS:.0f} ms)"
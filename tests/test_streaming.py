@@ -0,0 +1,54 @@
+import json
+from devops_cli.cache import ResponseCache
+from devops_cli.generators.k8s_generator import SYSTEM_PROMPT, K8sGenerator
+from devops_cli.llm_client import LLMClient
+from devops_cli.models.internal import GenerationRequest
+from devops_cli.streaming import ResourceStreamParser
+from tests.stub_openai import RESOURCES, StubOpenAI
+
+
+def parse_in_chunks(text, size):
+    parser = ResourceStreamParser()
+    found = []
+    for i in range(0, len(text), size):
+        found += list(parser.feed(text[i:i + size]))
+    return found
+
+
+def test_every_chunk_boundary_yields_the_same_resources():
+    resources = [{"kind": "ConfigMap", "metadata": {"name": "a"}}, {"kind": "Service", "metadata": {"name": "b"}}]
+    text = json.dumps({"resources": resources})
+    for size in range(1, len(text) + 1):
+        assert parse_in_chunks(text, size) == resources
+
+
+def test_strings_with_escaped_quotes_and_braces():
+    resources = [{"kind": "ConfigMap", "data": {"a": 'say "hi" {not} [an] object', "b": "}]\\", "c": '"'}}]
+    text = json.dumps({"resources": resources})
+    assert parse_in_chunks(text, 1) == resources
+    assert parse_in_chunks(text, 7) == resources
+
+
+def test_only_the_top_level_resources_key_counts():
+    nested = {"kind": "Custom", "spec": {"resources": [{"kind": "Inner"}]}}
+    text = json.dumps({"meta": {"resources": [{"kind": "Ignored"}]}, "note": "resources", "resources": [nested]})
+    assert parse_in_chunks(text, 3) == [nested]
+
+
+def test_invalid_cached_stream_entry_is_replaced(openai_url, tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    llm_client = LLMClient(api_key="stub", base_url=openai_url, cache=cache, max_retries=0)
+    generator = K8sGenerator(llm_client)
+    request = GenerationRequest(prompt="web frontend")
+    user_prompt = generator.build_user_prompt(request)
+    key = cache.make_key(llm_client.model, SYSTEM_PROMPT, user_prompt, llm_client.temperature, {"type": "json_object"})
+    cache.set(key, json.dumps({"resources": [{"kind": "Deployment", "metadata": {"name": "web"}}]}))
+
+    resources = list(generator.generate_stream(request))
+    assert [r.metadata.name for r in resources] == ["web"]
+    assert StubOpenAI.calls == 1
+    assert json.loads(cache.get(key)) == RESOURCES
+
+    # The fresh entry replays without calling the API again
+    assert len(list(generator.generate_stream(request))) == 1
+    assert StubOpenAI.calls == 1
@@ -0,0 +1,37 @@
+import json
+import threading
+from devops_cli.validators.k8s_validator import ValidationCache
+
+
+def test_concurrent_set_and_save_keep_every_entry(tmp_path):
+    path = str(tmp_path / "results.json")
+    cache = ValidationCache(path)
+    threads_count, per_thread = 8, 300
+
+    def worker(n):
+        for i in range(per_thread):
+            cache.set(f"{n}-{i}", {"valid": True})
+            if i % 10 == 0:
+                cache.save()
+        cache.save()
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(threads_count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    with open(path) as f:
+        saved = json.load(f)
+    assert len(saved) == threads_count * per_thread
+
+
+def test_save_merges_entries_from_other_instances(tmp_path):
+    path = str(tmp_path / "results.json")
+    first, second = ValidationCache(path), ValidationCache(path)
+    first.set("a", {"valid": True})
+    second.set("b", {"valid": False})
+    first.save()
+    second.save()
+
+    assert set(ValidationCache(path).entries) == {"a", "b"}